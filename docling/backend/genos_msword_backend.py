@@ -2,6 +2,7 @@ import logging
 import re
 from io import BytesIO
 from pathlib import Path
+from itertools import chain
 from typing import Any, List, Optional, Union
 from collections import defaultdict
 
@@ -46,6 +47,109 @@ from docling.datamodel.document import InputDocument
 
 _log = logging.getLogger(__name__)
 
+# 본문 순회(_walk_linear)에서 쓰는 네임스페이스와 XPath 는 요소마다 새로 만들지 않고 한 번만 컴파일
+_NS = {
+    "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
+    "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
+    "w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main",
+    "wp": "http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing",
+    "mc": "http://schemas.openxmlformats.org/markup-compatibility/2006",
+    "v": "urn:schemas-microsoft-com:vml",
+    "wps": "http://schemas.microsoft.com/office/word/2010/wordprocessingShape",
+    "w10": "urn:schemas-microsoft-com:office:word",
+    "a14": "http://schemas.microsoft.com/office/drawing/2010/main",
+}
+_XP_BLIP = etree.XPath(".//a:blip", namespaces=_NS)
+# Modern Word textboxes
+_XP_TXBX = etree.XPath(".//w:txbxContent|.//v:textbox//w:p", namespaces=_NS)
+# DrawingML / VML 의 대체(레거시) 텍스트박스
+_XP_ALT_TXBX = etree.XPath(".//wps:txbx//w:p|.//w10:wrap//w:p|.//a:p//a:t", namespaces=_NS)
+# 표준 텍스트박스가 아닌 도형 안의 텍스트
+_XP_SHAPE_TEXT = etree.XPath(".//a:bodyPr/ancestor::*//a:t|.//a:txBody//a:t", namespaces=_NS)
+# 본문 순회에서 요소 종류 판별용 Clark 표기 태그 (요소마다 QName 객체를 만들지 않고 element.tag 와 바로 비교)
+_NS_W = f"{{{_NS['w']}}}"
+_NS_R = f"{{{_NS['r']}}}"
+_TAG_P = _NS_W + "p"
+_TAG_TBL = _NS_W + "tbl"
+_TAG_SDT = _NS_W + "sdt"
+_TAG_SECTPR = _NS_W + "sectPr"
+_TAG_DRAWING = _NS_W + "drawing"
+_TAG_PICT = _NS_W + "pict"
+_TAG_ALT_CONTENT = f"{{{_NS['mc']}}}AlternateContent"
+_SHAPE_TAGS = (_TAG_DRAWING, _TAG_PICT)
+# w:numPr 는 문단(w:p)과 스타일(w:style) 모두 고정 위치 w:pPr/w:numPr 에만 존재
+_XP_NUMPR = etree.XPath("./w:pPr/w:numPr", namespaces=_NS)
+# numbering.xml 조회용 매개변수 XPath (호출마다 f-string 으로 식을 만들지 않음)
+_XP_NUM_ABSTRACT_ID = etree.XPath(".//w:num[@w:numId=$num_id]/w:abstractNumId", namespaces=_NS)
+_XP_ABSTRACT_LVL = etree.XPath(
+    ".//w:abstractNum[@w:abstractNumId=$abstract_id]/w:lvl[@w:ilvl=$ilvl]", namespaces=_NS
+)
+# lvlText 의 %1, %2 ... 자리표시자
+_PCT_RE = re.compile(r"%(\d+)")
+# 캐시에서 "아직 조회 안 함"과 "조회했지만 없음(None)"을 구분하기 위한 표식
+_MISSING = object()
+
+
+class _ParentsDict(dict[int, Optional[NodeItem]]):
+    """
+    레벨 → 부모 노드 맵.
+    _get_level 이 매번 전체를 훑지 않도록 "첫 번째 None 레벨(k >= 0)"을 캐시하고,
+    그 값이 바뀔 수 있는 대입이 있을 때만 무효화한다.
+    """
+
+    __slots__ = ("_first_none",)
+
+    def __init__(self) -> None:
+        super().__init__()
+        # None: 다시 계산 필요, -1: None 인 레벨이 없음
+        self._first_none: Optional[int] = None
+
+    def __setitem__(self, key: int, value: Any) -> None:
+        is_new = key not in self
+        super().__setitem__(key, value)
+        first = self._first_none
+        if first is None or key < 0 or (key == first and value is None):
+            return
+        if value is None:
+            # 새 키는 맨 뒤에 붙으므로 이미 찾은 첫 None 보다 앞설 수 없음
+            if not (is_new and first >= 0):
+                self._first_none = None
+        elif key == first:
+            self._first_none = None
+
+    # __setitem__ 외의 변경은 드물므로 캐시를 통째로 무효화
+    def __delitem__(self, key: int) -> None:
+        super().__delitem__(key)
+        self._first_none = None
+
+    def clear(self) -> None:
+        super().clear()
+        self._first_none = None
+
+    def pop(self, *args: Any) -> Any:
+        self._first_none = None
+        return super().pop(*args)
+
+    def popitem(self) -> tuple[int, Any]:
+        self._first_none = None
+        return super().popitem()
+
+    def setdefault(self, key: int, default: Any = None) -> Any:
+        self._first_none = None
+        return super().setdefault(key, default)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        # dict.update 는 __setitem__ 을 거치지 않음
+        super().update(*args, **kwargs)
+        self._first_none = None
+
+    def first_none_level(self) -> int:
+        if self._first_none is None:
+            self._first_none = next(
+                (k for k, v in self.items() if k >= 0 and v is None), -1
+            )
+        return self._first_none if self._first_none >= 0 else 0
+
 
 class GenosMsWordDocumentBackend(DeclarativeDocumentBackend):
     @override
@@ -65,16 +169,24 @@ class GenosMsWordDocumentBackend(DeclarativeDocumentBackend):
         # Initialise the parents for the hierarchy
         self.max_levels: int = 10
         self.level_at_new_list: Optional[int] = None
-        self.parents: dict[int, Optional[NodeItem]] = {}
+        self.parents: _ParentsDict = _ParentsDict()
         self.numbered_headers: dict[int, int] = {}
         self.equation_bookends: str = "<eq>{EQ}</eq>"
         # Track processed textbox elements to avoid duplication
-        self.processed_textbox_elements: List[int] = []
+        self.processed_textbox_elements: set[int] = set()
         # Track content hash of processed paragraphs to avoid duplicate content
-        self.processed_paragraph_content: List[str] = []
+        self.processed_paragraph_content: set[str] = set()
         # Track seen section texts for header detection (from hwpx_backend)
         self._seen_section_texts: set[str] = set()
         self.processed_table_elements: set[int] = set()
+        # numbering.xml 조회 결과 캐시 (같은 numId/ilvl 을 쓰는 문단이 많으므로 쌍마다 한 번만 조회)
+        self._numbering_root: Any = _MISSING
+        self._numbering_lvl_cache: dict[tuple[int, int], Any] = {}
+        self._numfmt_cache: dict[tuple[int, int], Optional[str]] = {}
+        self._is_numbered_cache: dict[tuple[int, int], bool] = {}
+        self._style_numid_cache: dict[str, tuple[Optional[int], Optional[int]]] = {}
+        self._lvl_text_parts_cache: dict[tuple[int, int], Optional[list]] = {}
+        self._rid_index: dict[int, dict[str, Any]] = {}
 
         for i in range(-1, self.max_levels):
             self.parents[i] = None
@@ -116,17 +228,6 @@ class GenosMsWordDocumentBackend(DeclarativeDocumentBackend):
             raise RuntimeError(
                 f"GenosMsWordDocumentBackend could not load document with hash {self.document_hash}"
             ) from e
-        try:
-            if isinstance(self.path_or_stream, BytesIO):
-                self.docx_obj = Document(self.path_or_stream)
-            elif isinstance(self.path_or_stream, Path):
-                self.docx_obj = Document(str(self.path_or_stream))
-
-            self.valid = True
-        except Exception as e:
-            raise RuntimeError(
-                f"GenosMsWordDocumentBackend could not load document with hash {self.document_hash}"
-            ) from e
 
     @override
     def is_valid(self) -> bool:
@@ -143,6 +244,16 @@ class GenosMsWordDocumentBackend(DeclarativeDocumentBackend):
             self.path_or_stream.close()
 
         self.path_or_stream = None
+        # 변환이 끝난 뒤에도 ConversionResult 가 backend 를 붙잡고 있으므로
+        # 파싱된 OOXML 트리와 그 요소를 가리키는 캐시를 여기서 놓아준다
+        self.docx_obj = None
+        self.package = None
+        self._numbering_root = _MISSING
+        self._numbering_lvl_cache.clear()
+        self._rid_index.clear()
+        self.processed_textbox_elements.clear()
+        self.processed_table_elements.clear()
+        self._seen_sectpr_ids.clear()
 
     @classmethod
     @override
@@ -215,10 +326,7 @@ class GenosMsWordDocumentBackend(DeclarativeDocumentBackend):
 
     def _get_level(self) -> int:
         """Return the first None index."""
-        for k, v in self.parents.items():
-            if k >= 0 and v is None:
-                return k
-        return 0
+        return self.parents.first_none_level()
 
     def _str_to_int(
         self, s: Optional[str], default: Optional[int] = 0
@@ -242,14 +350,14 @@ class GenosMsWordDocumentBackend(DeclarativeDocumentBackend):
         self, paragraph: Paragraph
     ) -> tuple[Optional[int], Optional[int]]:
         # Access the XML element of the paragraph
-        numPr = paragraph._element.find(
-            ".//w:numPr", namespaces=paragraph._element.nsmap
-        )
+        # (하위 트리 전체가 아니라 w:pPr/w:numPr 만 조회 - 문단 안 텍스트박스의 번호는 제외됨)
+        numPrs = _XP_NUMPR(paragraph._element)
 
-        if numPr is not None:
+        if numPrs:
+            numPr = numPrs[0]
             # Get the numId element and extract the value
-            numId_elem = numPr.find("w:numId", namespaces=paragraph._element.nsmap)
-            ilvl_elem = numPr.find("w:ilvl", namespaces=paragraph._element.nsmap)
+            numId_elem = numPr.find(_NS_W + "numId")
+            ilvl_elem = numPr.find(_NS_W + "ilvl")
             numId = numId_elem.get(self.XML_KEY) if numId_elem is not None else None
             ilvl = ilvl_elem.get(self.XML_KEY) if ilvl_elem is not None else None
 
@@ -267,16 +375,27 @@ class GenosMsWordDocumentBackend(DeclarativeDocumentBackend):
             style_element = getattr(style, "element", None)
             if style_element is None:
                 return None, None
-            # style_element.xml is a string; parse to an element to query
-            root = etree.fromstring(style_element.xml.encode("utf-8")) if isinstance(style_element.xml, str) else None
-            if root is None:
-                return None, None
-            ns = {"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"}
-            numPr = root.find('.//w:pPr/w:numPr', namespaces=ns)
-            if numPr is None:
+            # 같은 스타일의 문단은 결과가 같으므로 style_id 별로 캐시
+            style_id = getattr(style, "style_id", None)
+            if style_id is None:
+                return self._read_style_numId_and_ilvl(style_element)
+            cached = self._style_numid_cache.get(style_id)
+            if cached is None:
+                cached = self._style_numid_cache[style_id] = self._read_style_numId_and_ilvl(style_element)
+            return cached
+        except Exception:
+            return None, None
+
+    def _read_style_numId_and_ilvl(self, style_element) -> tuple[Optional[int], Optional[int]]:
+        """스타일 요소(w:style)의 w:pPr/w:numPr 에서 numId/ilvl 을 읽는다."""
+        try:
+            # style_element 는 이미 lxml 요소이므로 XML 문자열로 직렬화/재파싱하지 않고 바로 조회
+            numPrs = _XP_NUMPR(style_element)
+            if not numPrs:
                 return None, None
-            numId_elem = numPr.find('w:numId', namespaces=ns)
-            ilvl_elem = numPr.find('w:ilvl', namespaces=ns)
+            numPr = numPrs[0]
+            numId_elem = numPr.find(_NS_W + "numId")
+            ilvl_elem = numPr.find(_NS_W + "ilvl")
             numId = None
             ilvl = None
             if numId_elem is not None:
@@ -292,17 +411,45 @@ class GenosMsWordDocumentBackend(DeclarativeDocumentBackend):
     def _get_numbering_root(self, docx_obj: DocxDocument):
         """
         Locate and return the numbering part root element (numbering.xml) or None.
+        The result is cached after the first lookup.
         """
+        if self._numbering_root is not _MISSING:
+            return self._numbering_root
+        root = None
         try:
             for rel in docx_obj.part.rels.values():
                 reltype = getattr(rel, "reltype", "")
                 if isinstance(reltype, str) and reltype.endswith("/numbering"):
                     target_part = getattr(rel, "target_part", None)
                     if target_part is not None:
-                        return getattr(target_part, "_element", None)
+                        root = getattr(target_part, "_element", None)
+                        break
         except Exception:
-            return None
-        return None
+            root = None
+        self._numbering_root = root
+        return root
+
+    def _get_numbering_lvl(self, docx_obj: DocxDocument, numId: int, ilvl: int):
+        """
+        Return the w:lvl element of the abstract numbering behind numId/ilvl, or None.
+        Cached per (numId, ilvl).
+        """
+        key = (numId, ilvl)
+        lvl = self._numbering_lvl_cache.get(key, _MISSING)
+        if lvl is not _MISSING:
+            return lvl
+        lvl = None
+        numbering_root = self._get_numbering_root(docx_obj)
+        if numbering_root is not None:
+            abstract_ids = _XP_NUM_ABSTRACT_ID(numbering_root, num_id=str(numId))
+            if abstract_ids:
+                abstract_id = abstract_ids[0].get(self.XML_KEY)
+                if abstract_id:
+                    lvls = _XP_ABSTRACT_LVL(numbering_root, abstract_id=abstract_id, ilvl=str(ilvl))
+                    if lvls:
+                        lvl = lvls[0]
+        self._numbering_lvl_cache[key] = lvl
+        return lvl
 
     def _get_numFmt(
         self, docx_obj: DocxDocument, numId: Optional[int], ilvl: Optional[int]
@@ -314,23 +461,18 @@ class GenosMsWordDocumentBackend(DeclarativeDocumentBackend):
         try:
             if numId is None or ilvl is None:
                 return None
-            numbering_root = self._get_numbering_root(docx_obj)
-            if numbering_root is None:
-                return None
-            ns = {"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"}
-            num_xpath = f".//w:num[@w:numId='{numId}']/w:abstractNumId"
-            abstractNumId_el = numbering_root.find(num_xpath, namespaces=ns)
-            if abstractNumId_el is None:
-                return None
-            abstract_id = abstractNumId_el.get(self.XML_KEY)
-            if not abstract_id:
-                return None
-            base_xpath = f".//w:abstractNum[@w:abstractNumId='{abstract_id}']/w:lvl[@w:ilvl='{ilvl}']"
-            numFmt_el = numbering_root.find(base_xpath + "/w:numFmt", namespaces=ns)
-            if numFmt_el is None:
-                return None
-            fmt = numFmt_el.get(self.XML_KEY)
-            return str(fmt).lower() if fmt is not None else None
+            key = (numId, ilvl)
+            if key in self._numfmt_cache:
+                return self._numfmt_cache[key]
+            fmt_str = None
+            lvl = self._get_numbering_lvl(docx_obj, numId, ilvl)
+            if lvl is not None:
+                numFmt_el = lvl.find(_NS_W + "numFmt")
+                if numFmt_el is not None:
+                    fmt = numFmt_el.get(self.XML_KEY)
+                    fmt_str = str(fmt).lower() if fmt is not None else None
+            self._numfmt_cache[key] = fmt_str
+            return fmt_str
         except Exception:
             return None
 
@@ -342,24 +484,21 @@ class GenosMsWordDocumentBackend(DeclarativeDocumentBackend):
         if numId is None or ilvl is None:
             return None
         try:
-            numbering_root = self._get_numbering_root(docx_obj)
-            if numbering_root is None:
-                return None
-            ns = {"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"}
-            # Find abstractNumId via num
-            num_xpath = f".//w:num[@w:numId='{numId}']/w:abstractNumId"
-            abstractNumId_el = numbering_root.find(num_xpath, namespaces=ns)
-            if abstractNumId_el is None:
-                return None
-            abstract_id = abstractNumId_el.get(self.XML_KEY)
-            if abstract_id is None:
-                return None
-            # Find lvl for ilvl
-            lvl_xpath = f".//w:abstractNum[@w:abstractNumId='{abstract_id}']/w:lvl[@w:ilvl='{ilvl}']/w:lvlText"
-            lvlText_el = numbering_root.find(lvl_xpath, namespaces=ns)
-            if lvlText_el is None:
+            # lvlText 패턴은 (numId, ilvl) 별로 한 번만 읽어 %n 기준으로 미리 쪼개 둔다
+            # (짝수 칸: 리터럴, 홀수 칸: 카운터 인덱스)
+            key = (numId, ilvl)
+            if key in self._lvl_text_parts_cache:
+                parts = self._lvl_text_parts_cache[key]
+            else:
+                parts = None
+                lvl = self._get_numbering_lvl(docx_obj, numId, ilvl)
+                lvlText_el = lvl.find(_NS_W + "lvlText") if lvl is not None else None
+                if lvlText_el is not None:
+                    parts = _PCT_RE.split(lvlText_el.get(self.XML_KEY) or "")
+                    parts[1::2] = [int(d) - 1 for d in parts[1::2]]
+                self._lvl_text_parts_cache[key] = parts
+            if parts is None:
                 return None
-            pattern = lvlText_el.get(self.XML_KEY) or ""
             if not hasattr(self, "_num_counters_by_numid"):
                 self._num_counters_by_numid = {}
             counters = self._num_counters_by_numid.get(numId)
@@ -372,16 +511,12 @@ class GenosMsWordDocumentBackend(DeclarativeDocumentBackend):
             for j in range(level_idx + 1, len(counters)):
                 counters[j] = 0
             # Replace %n placeholders
-            def repl(m):
-                try:
-                    idx = int(m.group(1)) - 1
-                    if 0 <= idx < len(counters):
-                        return str(counters[idx]) if counters[idx] > 0 else ""
-                except Exception:
-                    pass
-                return ""
-            label = re.sub(r"%(\d+)", repl, pattern)
-            return label.strip()
+            chunks = parts[:]
+            n_counters = len(counters)
+            for i in range(1, len(chunks), 2):
+                idx = chunks[i]
+                chunks[i] = str(counters[idx]) if 0 <= idx < n_counters and counters[idx] > 0 else ""
+            return "".join(chunks).strip()
         except Exception:
             return None
 
@@ -395,6 +530,8 @@ class GenosMsWordDocumentBackend(DeclarativeDocumentBackend):
         - 그 외의 numFmt 는 True (대부분 순서형임)
         - numFmt 가 없을 경우 w:lvlText 의 "%1", "%2" 같은 플레이스홀더 존재시 True
         - 위를 모두 판정하지 못하면 False
+
+        판정 결과는 (numId, ilvl) 쌍마다 한 번만 계산해 캐시한다.
         """
         try:
             numid, ilvl = self._get_numId_and_ilvl(paragraph)
@@ -409,47 +546,45 @@ class GenosMsWordDocumentBackend(DeclarativeDocumentBackend):
             if numid is None or ilvl is None:
                 return False
 
-            numbering_root = self._get_numbering_root(docx_obj)
-            if numbering_root is None:
-                return False
+            key = (numid, ilvl)
+            is_numbered = self._is_numbered_cache.get(key)
+            if is_numbered is None:
+                is_numbered = self._is_numbered_cache[key] = self._is_ordered_lvl(
+                    self._get_numbering_lvl(docx_obj, numid, ilvl)
+                )
+            return is_numbered
+        except Exception:
+            return False
 
-            ns = {"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"}
-            # numId → abstractNumId
-            num_xpath = f".//w:num[@w:numId='{numid}']/w:abstractNumId"
-            abstractNumId_el = numbering_root.find(num_xpath, namespaces=ns)
-            if abstractNumId_el is None:
+    def _is_ordered_lvl(self, lvl) -> bool:
+        """_is_numbered_list 의 판정 기준을 w:lvl 요소에 적용"""
+        if lvl is None:
+            return False
+
+        # 1) 명시적 numFmt 우선
+        numFmt_el = lvl.find(_NS_W + "numFmt")
+        if numFmt_el is not None:
+            fmt = numFmt_el.get(self.XML_KEY)
+            if fmt is None:
                 return False
-            abstract_id = abstractNumId_el.get(self.XML_KEY)
-            if not abstract_id:
+            fmt_str = str(fmt).lower()
+            if fmt_str in ("bullet", "none"):
                 return False
+            # bullet/none 이외 대부분은 순서형으로 간주
+            return True
 
-            base_xpath = f".//w:abstractNum[@w:abstractNumId='{abstract_id}']/w:lvl[@w:ilvl='{ilvl}']"
-            # 1) 명시적 numFmt 우선
-            numFmt_el = numbering_root.find(base_xpath + "/w:numFmt", namespaces=ns)
-            if numFmt_el is not None:
-                fmt = numFmt_el.get(self.XML_KEY)
-                if fmt is None:
-                    return False
-                fmt_str = str(fmt).lower()
-                if fmt_str in ("bullet", "none"):
-                    return False
-                # bullet/none 이외 대부분은 순서형으로 간주
+        # 2) numFmt 없으면 lvlText 패턴으로 추정
+        lvlText_el = lvl.find(_NS_W + "lvlText")
+        if lvlText_el is not None:
+            pattern = lvlText_el.get(self.XML_KEY) or ""
+            # %n 플레이스홀더가 있으면 순서형
+            if re.search(r"%\d+", pattern):
                 return True
+            # 대표적인 불릿 기호가 포함되어 있으면 비순서형으로 간주
+            if any(ch in pattern for ch in ("•", "●", "■", "–", "-", "○", "▪")):
+                return False
 
-            # 2) numFmt 없으면 lvlText 패턴으로 추정
-            lvlText_el = numbering_root.find(base_xpath + "/w:lvlText", namespaces=ns)
-            if lvlText_el is not None:
-                pattern = lvlText_el.get(self.XML_KEY) or ""
-                # %n 플레이스홀더가 있으면 순서형
-                if re.search(r"%\d+", pattern):
-                    return True
-                # 대표적인 불릿 기호가 포함되어 있으면 비순서형으로 간주
-                if any(ch in pattern for ch in ("•", "●", "■", "–", "-", "○", "▪")):
-                    return False
-
-            return False
-        except Exception:
-            return False
+        return False
 
     def _get_heading_and_level(self, style_label: str) -> tuple[str, Optional[int]]:
         parts = self._split_text_and_number(style_label)
@@ -522,8 +657,13 @@ class GenosMsWordDocumentBackend(DeclarativeDocumentBackend):
         """
         if not owner_part or not rId:
             return None
-        rel = owner_part.rels.get(rId)
-        return getattr(rel, "target_part", None) if rel else None
+        # 파트별 rId → target_part 인덱스를 한 번만 만들어 재사용 (외부 링크 관계는 제외)
+        index = self._rid_index.get(id(owner_part))
+        if index is None:
+            index = self._rid_index[id(owner_part)] = {
+                rid: rel.target_part for rid, rel in owner_part.rels.items() if not rel.is_external
+            }
+        return index.get(rId)
     # TODO: Restore and Edit Header/Footer logic
     # def _is_owner_header_footer(self, owner_part) -> bool:
     #     try:
@@ -570,6 +710,29 @@ class GenosMsWordDocumentBackend(DeclarativeDocumentBackend):
     #                 )
     #             finally:
     #                 self._in_hf = original_hf
+    @staticmethod
+    def _iter_linear_elements(body: BaseOxmlElement):
+        """
+        body 의 자식 요소를 문서 순서대로 내보낸다.
+        mc:AlternateContent 는 mc:Choice 분기만 펼쳐서(Fallback 은 건너뜀) 그 자리에 이어 붙인다.
+        재귀 호출 대신 반복자 스택을 사용하므로 깊게 중첩된 문서에서도 호출 프레임이 쌓이지 않는다.
+        """
+        stack = [iter(body)]
+        while stack:
+            element = next(stack[-1], None)
+            if element is None:
+                stack.pop()
+                continue
+            if element.tag == _TAG_ALT_CONTENT:
+                # find the mc:Choice branch and process only that
+                choice = element.find("mc:Choice", namespaces=_NS)
+                if choice is not None:
+                    # Choice 의 각 자식을 body 로 삼아 그 자식들을 순서대로 이어서 처리
+                    stack.append(chain.from_iterable(choice))
+                # skip the rest (Fallback)
+                continue
+            yield element
+
     def _walk_linear(
         self,
         body: BaseOxmlElement,
@@ -605,42 +768,19 @@ class GenosMsWordDocumentBackend(DeclarativeDocumentBackend):
         #         print(f"[HF] enter {group_name}")
         #     except Exception:
         #         pass
-        for element in body:
+        for element in self._iter_linear_elements(body):
 
             # Check for Inline Images (blip elements)
-            namespaces = {
-                "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
-                "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
-                "w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main",
-                "wp": "http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing",
-                "mc": "http://schemas.openxmlformats.org/markup-compatibility/2006",
-                "v": "urn:schemas-microsoft-com:vml",
-                "wps": "http://schemas.microsoft.com/office/word/2010/wordprocessingShape",
-                "w10": "urn:schemas-microsoft-com:office:word",
-                "a14": "http://schemas.microsoft.com/office/drawing/2010/main",
-            }
-            xpath_expr = etree.XPath(".//a:blip", namespaces=namespaces)
-            drawing_blip = xpath_expr(element)
-            # Skip the fallback inside mc:AlternateContent
-            tag = etree.QName(element).localname
-            if tag == "AlternateContent":
-                # find the mc:Choice branch and process only that
-                choice = element.find("mc:Choice", namespaces=namespaces)
-                if choice is not None:
-                    # inline its children into our loop
-                    for child in choice:
-                        doc = self._walk_linear(child, docx_obj, doc, owner_part)
-                # skip the rest (Fallback)
-                continue
-            tag_name = etree.QName(element).localname
+            drawing_blip = _XP_BLIP(element)
+            tag = element.tag
             # 1) body 직속 sectPr (드물지만 존재)
             sectprs = []
-            if tag_name == "sectPr":
+            if tag == _TAG_SECTPR:
                 sectprs = [element]
 
             # 2) 일반 케이스: 문단 pPr 안의 sectPr
-            elif tag_name == "p":
-                sectprs = element.findall("./w:pPr/w:sectPr", namespaces=namespaces)
+            elif tag == _TAG_P:
+                sectprs = element.findall("./w:pPr/w:sectPr", namespaces=_NS)
 
             # 3) 만난 순서대로 전부 처리 (중복 방지)
             for sectPr_el in sectprs:
@@ -661,27 +801,16 @@ class GenosMsWordDocumentBackend(DeclarativeDocumentBackend):
             element_id = id(element)
             if element_id not in self.processed_textbox_elements:
                 # Modern Word textboxes
-                txbx_xpath = etree.XPath(
-                    ".//w:txbxContent|.//v:textbox//w:p", namespaces=namespaces
-                )
-                textbox_elements = txbx_xpath(element)
+                textbox_elements = _XP_TXBX(element)
 
                 # No modern textboxes found, check for alternate/legacy textbox formats
-                if not textbox_elements and tag_name in ["drawing", "pict"]:
+                if not textbox_elements and tag in _SHAPE_TAGS:
                     # Additional checks for textboxes in DrawingML and VML formats
-                    alt_txbx_xpath = etree.XPath(
-                        ".//wps:txbx//w:p|.//w10:wrap//w:p|.//a:p//a:t",
-                        namespaces=namespaces,
-                    )
-                    textbox_elements = alt_txbx_xpath(element)
+                    textbox_elements = _XP_ALT_TXBX(element)
 
                     # Check for shape text that's not in a standard textbox
                     if not textbox_elements:
-                        shape_text_xpath = etree.XPath(
-                            ".//a:bodyPr/ancestor::*//a:t|.//a:txBody//a:t",
-                            namespaces=namespaces,
-                        )
-                        shape_text_elements = shape_text_xpath(element)
+                        shape_text_elements = _XP_SHAPE_TEXT(element)
                         if shape_text_elements:
                             # Create custom text elements from shape text
                             text_content = " ".join(
@@ -714,19 +843,19 @@ class GenosMsWordDocumentBackend(DeclarativeDocumentBackend):
 
                 if textbox_elements:
                     # Mark the parent element as processed
-                    self.processed_textbox_elements.append(element_id)
+                    self.processed_textbox_elements.add(element_id)
                     # Also mark all found textbox elements as processed
                     for tb_element in textbox_elements:
-                        self.processed_textbox_elements.append(id(tb_element))
+                        self.processed_textbox_elements.add(id(tb_element))
 
                     self._handle_textbox_content(textbox_elements, docx_obj, doc)
 
             # Check for shape content (similar to hwpx_backend's _process_rect)
-            if tag_name in ["drawing", "pict"] and element_id not in self.processed_textbox_elements:
+            if tag in _SHAPE_TAGS and element_id not in self.processed_textbox_elements:
                 self._handle_shape_content(element, docx_obj, doc, owner_part=owner_part)
 
             # Check for Tables - Use enhanced table processing
-            if element.tag.endswith("tbl"):
+            if tag == _TAG_TBL:
                 try:
                     # TODO: Restore and Edit Header/Footer logic
                     # if header_footer_ctx_opened:
@@ -749,14 +878,14 @@ class GenosMsWordDocumentBackend(DeclarativeDocumentBackend):
                 #         pass
                 self._handle_pictures(owner_part, docx_obj, drawing_blip, doc)
                 # 이미지 뒤 텍스트 처리
-                if (tag_name in ["p"]
-                    and (element.find(".//w:t", namespaces=namespaces) is not None or element.find(".//w:instrText", namespaces=namespaces) is not None)):
+                if (tag == _TAG_P
+                    and (element.find(".//w:t", namespaces=_NS) is not None or element.find(".//w:instrText", namespaces=_NS) is not None)):
                     # TODO: Restore and Edit Header/Footer logic
                     # if header_footer_ctx_opened:
                     #     try:
-                    #         texts = [t.text for t in element.findall(".//w:t", namespaces=namespaces) if t.text]
-                    #         instrs = [t.text for t in element.findall(".//w:instrText", namespaces=namespaces) if t.text]
-                    #         fldchars = [fc.get("{http://schemas.openxmlformats.org/wordprocessingml/2006/main}fldCharType") for fc in element.findall(".//w:fldChar", namespaces=namespaces)]
+                    #         texts = [t.text for t in element.findall(".//w:t", namespaces=_NS) if t.text]
+                    #         instrs = [t.text for t in element.findall(".//w:instrText", namespaces=_NS) if t.text]
+                    #         fldchars = [fc.get("{http://schemas.openxmlformats.org/wordprocessingml/2006/main}fldCharType") for fc in element.findall(".//w:fldChar", namespaces=_NS)]
                     #         parts = []
                     #         if texts:
                     #             parts.append(" ".join(texts))
@@ -772,8 +901,8 @@ class GenosMsWordDocumentBackend(DeclarativeDocumentBackend):
                     self._handle_text_elements(element, docx_obj, doc)    
                               
             # Check for the sdt containers, like table of contents
-            elif tag_name in ["sdt"]:
-                sdt_content = element.find(".//w:sdtContent", namespaces=namespaces)
+            elif tag == _TAG_SDT:
+                sdt_content = element.find(".//w:sdtContent", namespaces=_NS)
                 if sdt_content is not None:
                     # TODO: Restore and Edit Header/Footer logic
                     # if header_footer_ctx_opened:
@@ -781,18 +910,18 @@ class GenosMsWordDocumentBackend(DeclarativeDocumentBackend):
                     #         print("[HF] handle sdt content")
                     #     except Exception:
                     #         pass
-                    paragraphs = sdt_content.findall(".//w:p", namespaces=namespaces)
+                    paragraphs = sdt_content.findall(".//w:p", namespaces=_NS)
                     for p in paragraphs:
                         self._handle_text_elements(p, docx_obj, doc)
             # Check for Text
-            elif tag_name in ["p"]:
+            elif tag == _TAG_P:
                 # "tcPr", "sectPr"
                 # TODO: Restore and Edit Header/Footer logic
                 # if header_footer_ctx_opened:
                 #     try:
-                #         texts = [t.text for t in element.findall(".//w:t", namespaces=namespaces) if t.text]
-                #         instrs = [t.text for t in element.findall(".//w:instrText", namespaces=namespaces) if t.text]
-                #         fldchars = [fc.get("{http://schemas.openxmlformats.org/wordprocessingml/2006/main}fldCharType") for fc in element.findall(".//w:fldChar", namespaces=namespaces)]
+                #         texts = [t.text for t in element.findall(".//w:t", namespaces=_NS) if t.text]
+                #         instrs = [t.text for t in element.findall(".//w:instrText", namespaces=_NS) if t.text]
+                #         fldchars = [fc.get("{http://schemas.openxmlformats.org/wordprocessingml/2006/main}fldCharType") for fc in element.findall(".//w:fldChar", namespaces=_NS)]
                 #         parts = []
                 #         if texts:
                 #             parts.append(" ".join(texts))
@@ -825,26 +954,18 @@ class GenosMsWordDocumentBackend(DeclarativeDocumentBackend):
         <w:drawing> 혹은 VML <v:imagedata> 같은 요소에서
         Word 관계(rId)를 찾아 이미지를 추출합니다.
         """
-        # Word ML namespace
-        ns = {
-            "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
-            "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
-            "wp": "http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing",
-            "pic": "http://schemas.openxmlformats.org/drawingml/2006/picture",
-        }
-
         # 1) <a:blip> 찾기
-        blip = drawing_el.find(".//a:blip", namespaces=ns)
+        blip = drawing_el.find(".//a:blip", namespaces=_NS)
         if blip is None:
             return None
 
         # 2) 관계 ID 추출
-        embed_rId = blip.get("{http://schemas.openxmlformats.org/officeDocument/2006/relationships}embed")
-        if not embed_rId or embed_rId not in docx_obj.part.rels:
+        embed_rId = blip.get(_NS_R + "embed")
+        image_part = self._resolve_part_by_rid(docx_obj.part, embed_rId)
+        if image_part is None:
             return None
 
         # 3) 이미지 바이너리 가져오기
-        image_part = docx_obj.part.rels[embed_rId].target_part
         blob = image_part.blob
         try:
             pil_img = Image.open(BytesIO(blob))
@@ -912,14 +1033,12 @@ class GenosMsWordDocumentBackend(DeclarativeDocumentBackend):
         table = Table(element, docx_obj)
         num_rows = len(table.rows)
         num_cols = len(table.columns)
-        ns = element.nsmap
-
         # 2) table-level detection: 중첩 tbl / 그림이 있는지
         #    - [0]번째는 자기 자신(<w:tbl>)이 잡히기 때문에 [1:]로 실제 중첩 테이블만
-        nested_tbls_global = element.findall('.//w:tbl', namespaces=ns)[1:]
+        nested_tbls_global = element.findall('.//w:tbl', namespaces=_NS)[1:]
         pics_global = (
-            element.findall('.//w:drawing', namespaces=ns) +
-            element.findall('.//v:imagedata', namespaces=ns)
+            element.findall('.//w:drawing', namespaces=_NS) +
+            element.findall('.//v:imagedata', namespaces=_NS)
         )
         table_has_nested = bool(nested_tbls_global)
         table_has_pics   = bool(pics_global)
@@ -936,10 +1055,9 @@ class GenosMsWordDocumentBackend(DeclarativeDocumentBackend):
         cell_buffer = defaultdict(list)
             
         def get_docx_image_bytes_from_owner(drawing_blip: List[etree._Element]) -> Optional[bytes]:
-            rId = drawing_blip[0].get("{http://schemas.openxmlformats.org/officeDocument/2006/relationships}embed")
-            if not rId or rId not in owner_part.rels:
-                return None
-            return owner_part.rels[rId].target_part.blob
+            rId = drawing_blip[0].get(_NS_R + "embed")
+            image_part = self._resolve_part_by_rid(owner_part, rId)
+            return image_part.blob if image_part is not None else None
         
         # 4) 각 셀 순회
         for r_idx, row in enumerate(table.rows):
@@ -965,7 +1083,7 @@ class GenosMsWordDocumentBackend(DeclarativeDocumentBackend):
                             # -- 1) 텍스트 수집
                             texts = [
                                 t.text.strip()
-                                for t in ch.findall(".//w:t", namespaces=ns)
+                                for t in ch.findall(".//w:t", namespaces=_NS)
                                 if t.text and t.text.strip()
                             ]
                             if texts:
@@ -974,7 +1092,7 @@ class GenosMsWordDocumentBackend(DeclarativeDocumentBackend):
                                 continue
 
                             # -- 2) drawing 수집
-                            drawings = ch.findall(".//w:drawing", namespaces=ns)
+                            drawings = ch.findall(".//w:drawing", namespaces=_NS)
                             if drawings:
                                 blob = get_docx_image_bytes_from_owner(drawings)
                                 if blob is None:
@@ -1474,8 +1592,6 @@ class GenosMsWordDocumentBackend(DeclarativeDocumentBackend):
         original_parent = self.parents[level]
         self.parents[level] = textbox_group
 
-        ns = {"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"}
-
         # 1) textbox_elements 중 실제 txbxContent 노드만 뽑기
         txbx_contents = [
             el for el in textbox_elements
@@ -1702,7 +1818,7 @@ class GenosMsWordDocumentBackend(DeclarativeDocumentBackend):
             content_hash = f"{len(raw_text)}:{raw_text[:50]}"
             if content_hash in self.processed_paragraph_content:
                 return
-            self.processed_paragraph_content.append(content_hash)
+            self.processed_paragraph_content.add(content_hash)
 
         text, equations = self._handle_equations_in_text(element=element, text=raw_text)
 
@@ -2210,21 +2326,21 @@ class GenosMsWordDocumentBackend(DeclarativeDocumentBackend):
             image_format: Optional[str] = None
             
             rId = drawing_blip[0].get(
-                "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}embed"
+                _NS_R + "embed"
             )
-            if rId in docx_obj.part.rels:
-                # Access the image part using the relationship ID
-                image_part = docx_obj.part.rels[rId].target_part
+            # Access the image part using the relationship ID
+            image_part = self._resolve_part_by_rid(docx_obj.part, rId)
+            if image_part is not None:
                 image_data = image_part.blob  # Get the binary image data
                 # Try to get content type to identify format
                 image_format = getattr(image_part, 'content_type', None)
                 
             return image_data, image_format
         def get_image_info_from_owner(owner_part, drawing_blip: Any) -> tuple[Optional[bytes], Optional[str]]:
-            rId = drawing_blip[0].get("{http://schemas.openxmlformats.org/officeDocument/2006/relationships}embed")
-            if not rId or rId not in owner_part.rels:
+            rId = drawing_blip[0].get(_NS_R + "embed")
+            image_part = self._resolve_part_by_rid(owner_part, rId)
+            if image_part is None:
                 return None, None
-            image_part = owner_part.rels[rId].target_part
             image_data = image_part.blob
             image_format = getattr(image_part, 'content_type', None)
             return image_data, image_format
@@ -2321,8 +2437,8 @@ class GenosMsWordDocumentBackend(DeclarativeDocumentBackend):
             )
             
         except (UnidentifiedImageError, OSError) as e:
-            print(f"Pillow failed to load image: {e}")
-            print(f"Attempting Wand conversion for format: {image_format}")
+            _log.debug(f"Pillow failed to load image: {e}")
+            _log.debug(f"Attempting Wand conversion for format: {image_format}")
             
             # WMF/EMF 형식 처리 시도 (Wand 사용)
             if WAND_AVAILABLE and image_format and ('wmf' in image_format.lower() or 'emf' in image_format.lower()):
@@ -2348,7 +2464,7 @@ class GenosMsWordDocumentBackend(DeclarativeDocumentBackend):
                             )
                             return
                 except (WandException, Exception) as wand_error:
-                    print(f"Wand conversion failed: {wand_error}")
+                    _log.debug(f"Wand conversion failed: {wand_error}")
                 
                 # 다른 형식도 Wand로 시도
                 if WAND_AVAILABLE:
@@ -2374,7 +2490,7 @@ class GenosMsWordDocumentBackend(DeclarativeDocumentBackend):
                                 )
                                 return
                     except (WandException, Exception) as wand_error:
-                        print(f"Wand fallback conversion failed: {wand_error}")
+                        _log.debug(f"Wand fallback conversion failed: {wand_error}")
                 
                 # 최종적으로 빈 이미지 플레이스홀더 추가
                 doc.add_picture(
@@ -1,8 +1,19 @@
+import os
+import sys
+
 bind = "0.0.0.0:8080"
 
-workers = 5
+# 워커마다 레이아웃/TableFormer 모델(GPU 에서는 CUDA 컨텍스트까지)을 따로 올리고
+# 각 DocumentProcessor 가 num_threads=8 로 torch 스레드를 쓰므로 코어 수만큼 늘리지 않는다.
+# 배포 환경에 맞게 GUNICORN_WORKERS 로 조정 (기본값은 기존 고정값 5)
+workers = int(os.getenv("GUNICORN_WORKERS", "5"))
 worker_class = "uvicorn.workers.UvicornWorker"
 
+# preload_app 은 쓰지 않는다: main.py 가 import 시점에 DocumentProcessor 를 만들므로
+# 마스터에서 torch(OpenMP 스레드풀)와 모델/CUDA 가 올라간 채로 fork 되는 것을 피하기 위함
+# torch.cuda.is_available() 확인만으로 CUDA 가 초기화되지 않도록 NVML 기반 확인 사용
+os.environ.setdefault("PYTORCH_NVML_BASED_CUDA_CHECK", "1")
+
 BASE_DIR = "/app"
 pythonpath = BASE_DIR + "/src"
 chdir = BASE_DIR
@@ -12,4 +23,16 @@ timeout = 0
 
 loglevel = "info"
 accesslog = "-"
-errorlog = "-"
\ No newline at end of file
+errorlog = "-"
+
+
+# 워커 시작 시 모델 미리 로드 (fork 이후 워커마다 실행). DOC_PARSER_WARMUP=0 이면 끔
+def post_worker_init(worker):
+    if os.getenv("DOC_PARSER_WARMUP", "1") != "1":
+        return
+    # supervisor.conf 는 src.main:app 으로 띄운다
+    app_module = sys.modules.get("src.main") or sys.modules.get("main")
+    processor = getattr(app_module, "processor", None)
+    warmup = getattr(processor, "warmup", None)
+    if warmup is not None:
+        warmup()
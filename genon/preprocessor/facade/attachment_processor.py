@@ -1,11 +1,17 @@
 from __future__ import annotations
 
-from collections import defaultdict
+from bisect import insort
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from itertools import accumulate, chain, groupby
 
 import asyncio
 import fitz
+import importlib.util
 import json
 import math
+import numpy as np
 import os
 import pandas as pd
 import pydub
@@ -55,6 +61,18 @@ try:
 except ImportError:
     print("Warning: WeasyPrint could not be imported. PDF conversion features will be disabled.")
     HTML = None
+try:
+    import orjson
+
+    def json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    def json_dumps(obj) -> str:
+        # orjson과 같은 compact 출력 (구분자 공백 제거)
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+# 빈 리스트의 JSON 표현 (청크마다 다시 인코딩하지 않도록 상수로 둠)
+_EMPTY_JSON_LIST = "[]"
 
 from docling.datamodel.base_models import InputFormat
 from docling.datamodel.pipeline_options import PipelineOptions
@@ -90,6 +108,9 @@ for n in ("fontTools", "fontTools.ttLib", "fontTools.ttLib.ttFont"):
 # pdf 변환 대상 확장자
 CONVERTIBLE_EXTENSIONS = ['.hwp', '.txt', '.json', '.md', '.ppt', '.pptx', '.docx']
 
+# docling 변환은 CPU 바운드 동기 작업이라 이벤트 루프 밖의 전용 스레드풀에서 실행
+_CONVERT_EXECUTOR = ThreadPoolExecutor(max_workers=int(os.getenv("DOCLING_WORKERS", "4")))
+
 
 def convert_to_pdf(file_path: str) -> str | None:
     """
@@ -172,13 +193,26 @@ def _get_pdf_path(file_path: str) -> str:
 
 def install_packages(packages):
     for package in packages:
-        try:
-            __import__(package)
-        except ImportError:
+        # 모듈을 실제로 import 하지 않고 설치 여부만 확인
+        if importlib.util.find_spec(package) is None:
             print(f"[!] {package} 패키지가 없습니다. 설치를 시도합니다.")
             subprocess.run([sys.executable, "-m", "pip", "install", package], check=True)
 
 
+async def install_packages_async(packages):
+    """install_packages 의 비동기 버전. 이벤트 루프를 막지 않고 pip 를 실행한다."""
+    for package in packages:
+        if importlib.util.find_spec(package) is None:
+            print(f"[!] {package} 패키지가 없습니다. 설치를 시도합니다.")
+            proc = await asyncio.create_subprocess_exec(
+                sys.executable, "-m", "pip", "install", package,
+                stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+            )
+            _, stderr = await proc.communicate()
+            if proc.returncode != 0:
+                raise subprocess.CalledProcessError(proc.returncode, f"pip install {package}", stderr=stderr)
+
+
 class GenOSVectorMeta(BaseModel):
     class Config:
         extra = 'allow'
@@ -199,7 +233,62 @@ class GenOSVectorMeta(BaseModel):
     media_files: str | None = None
 
 
+def _chunk_bboxes_json(doc_items: list, page_sizes: dict[int, tuple[float, float]]) -> tuple[str, Optional[int]]:
+    """청크 아이템들의 정규화된 bbox JSON 과 마지막 페이지 번호를 반환"""
+    provs = [(item, prov) for item in doc_items for prov in item.prov]
+    if not provs:
+        return _EMPTY_JSON_LIST, None
+
+    # 좌표 정규화를 파이썬 루프 대신 배열 연산 한 번으로 처리
+    pages = [prov.page_no for _, prov in provs]
+    coords = np.array(
+        [(prov.bbox.l, prov.bbox.t, prov.bbox.r, prov.bbox.b) for _, prov in provs],
+        dtype=np.float64,
+    )
+    wh = np.array([page_sizes[p] for p in pages], dtype=np.float64)
+    wh = np.hstack((wh, wh))
+    np.divide(coords, wh, out=coords)
+
+    chunk_bboxes = [
+        {
+            'page': prov.page_no,
+            'bbox': {
+                'l': l, 't': t, 'r': r, 'b': b,
+                'coord_origin': prov.bbox.coord_origin.value
+            },
+            'type': item.label,
+            'ref': item.self_ref
+        }
+        for (item, prov), (l, t, r, b) in zip(provs, coords.tolist())
+    ]
+    return json_dumps(chunk_bboxes), max(pages)
+
+
+def _media_files_json(doc_items: list, name_cache: Optional[dict[str, str]] = None) -> str:
+    """청크 아이템 중 그림들의 media_files JSON (name_cache 는 문서 단위 self_ref → 파일명 캐시)"""
+    if not doc_items:
+        return ""
+    pictures = [item for item in doc_items if isinstance(item, PictureItem)]
+    if not pictures:
+        return _EMPTY_JSON_LIST
+    if name_cache is None:
+        name_cache = {}
+    temp_list = []
+    for item in pictures:
+        name = name_cache.get(item.self_ref)
+        if name is None:
+            name = name_cache[item.self_ref] = str(item.image.uri).rpartition("/")[2]
+        temp_list.append({'name': name, 'type': 'image', 'ref': item.self_ref})
+    return json_dumps(temp_list)
+
+
 class GenOSVectorMetaBuilder:
+    # 청크마다 생성되므로 인스턴스 __dict__ 없이 고정 슬롯만 사용
+    __slots__ = (
+        'text', 'n_char', 'n_word', 'n_line', 'i_page', 'e_page', 'i_chunk_on_page', 'n_chunk_of_page',
+        'i_chunk_on_doc', 'n_chunk_of_doc', 'n_page', 'reg_date', 'chunk_bboxes', 'media_files',
+    )
+
     def __init__(self):
         """빌더 초기화"""
         self.text: Optional[str] = None
@@ -246,48 +335,19 @@ class GenOSVectorMetaBuilder:
                 setattr(self, key, value)
         return self
 
-    def set_chunk_bboxes(self, doc_items: list, document: DoclingDocument) -> "GenOSVectorMetaBuilder":
-        chunk_bboxes = []
-        for item in doc_items:
-            for prov in item.prov:
-                label = item.self_ref
-                type_ = item.label
-                size = document.pages.get(prov.page_no).size
-                page_no = prov.page_no
-                bbox = prov.bbox
-                bbox_data = {
-                    'l': bbox.l / size.width,
-                    't': bbox.t / size.height,
-                    'r': bbox.r / size.width,
-                    'b': bbox.b / size.height,
-                    'coord_origin': bbox.coord_origin.value
-                }
-                chunk_bboxes.append({
-                    'page': page_no,
-                    'bbox': bbox_data,
-                    'type': type_,
-                    'ref': label
-                })
-        self.e_page = max([bbox['page'] for bbox in chunk_bboxes]) if chunk_bboxes else None
-        self.chunk_bboxes = json.dumps(chunk_bboxes)
+    def set_chunk_bboxes(self, doc_items: list, page_sizes: dict[int, tuple[float, float]]) -> "GenOSVectorMetaBuilder":
+        self.chunk_bboxes, self.e_page = _chunk_bboxes_json(doc_items, page_sizes)
         return self
 
-    def set_media_files(self, doc_items: list) -> "GenOSVectorMetaBuilder":
-        temp_list = []
-        if not doc_items:
-            self.media_files = ""
-            return self
-        for item in doc_items:
-            if isinstance(item, PictureItem):
-                path = str(item.image.uri)
-                name = path.rsplit("/", 1)[-1]
-                temp_list.append({'name': name, 'type': 'image', 'ref': item.self_ref})
-        self.media_files = json.dumps(temp_list)
+    def set_media_files(self, doc_items: list, name_cache: Optional[dict[str, str]] = None) -> "GenOSVectorMetaBuilder":
+        """name_cache: 문서 단위로 공유하는 self_ref → 파일명 캐시 (같은 그림이 여러 청크에 걸칠 때 재계산 방지)"""
+        self.media_files = _media_files_json(doc_items, name_cache)
         return self
 
     def build(self) -> GenOSVectorMeta:
         """설정된 데이터를 사용해 최종적으로 GenOSVectorMeta 객체 생성"""
-        return GenOSVectorMeta(
+        # 빌더가 이미 타입이 맞는 값만 채우므로 청크마다 pydantic 검증을 거치지 않음
+        return GenOSVectorMeta.model_construct(
             text=self.text,
             n_char=self.n_char,
             n_word=self.n_word,
@@ -637,6 +697,37 @@ class AudioLoader:
 #  * HwpxProcessor              #
 #  * GenosServiceException      #
 
+# (아이템 타입, 라벨) → 청킹 분류 캐시. isinstance 체인을 타입/라벨 조합당 한 번만 평가
+_ITEM_KIND_CACHE: dict[tuple[type, Any], Optional[str]] = {}
+
+
+def _item_kind(item) -> Optional[str]:
+    """HierarchicalChunker 에서 아이템을 처리할 분류를 반환. DocItem 이 아니면 None."""
+    key = (type(item), getattr(item, "label", None))
+    try:
+        return _ITEM_KIND_CACHE[key]
+    except KeyError:
+        pass
+    if not isinstance(item, DocItem):
+        kind = None
+    elif isinstance(item, ListItem) or (  # TODO remove when all captured as ListItem:
+            isinstance(item, TextItem) and item.label == DocItemLabel.LIST_ITEM):
+        kind = "list"
+    elif isinstance(item, SectionHeaderItem) or (
+            isinstance(item, TextItem) and item.label in [DocItemLabel.SECTION_HEADER, DocItemLabel.TITLE]):
+        kind = "header"
+    elif isinstance(item, TextItem):
+        kind = "text"
+    elif isinstance(item, TableItem):
+        kind = "table"
+    elif isinstance(item, PictureItem):
+        kind = "picture"
+    else:
+        kind = "other"
+    _ITEM_KIND_CACHE[key] = kind
+    return kind
+
+
 class HierarchicalChunker(BaseChunker):
     r""" Chunker implementation leveraging the document layout.
     Args:
@@ -676,96 +767,109 @@ class HierarchicalChunker(BaseChunker):
             Iterator[Chunk]: iterator over extracted chunks
         """
         heading_by_level: dict[LevelNumber, str] = {}
+        # heading_by_level 의 레벨을 오름차순으로 유지 (헤더마다 다시 정렬하지 않도록 bisect 로 삽입)
+        sorted_levels: list[LevelNumber] = []
+        # 레벨 순으로 정렬된 헤딩 목록과 그림 청크 텍스트; 헤더를 만날 때만 갱신
+        headings: Optional[list[str]] = None
+        heading_text = ""
         list_items: list[TextItem] = []
         for item, level in dl_doc.iterate_items():
             captions = None
-            if isinstance(item, DocItem):
-                # first handle any merging needed
-                if self.merge_list_items:
-                    if isinstance(
-                            item, ListItem
-                    ) or (  # TODO remove when all captured as ListItem:
-                            isinstance(item, TextItem)
-                            and item.label == DocItemLabel.LIST_ITEM
-                    ):
-                        list_items.append(item)
-                        continue
-                    elif list_items:  # need to yield
-                        yield DocChunk(
-                            text=self.delim.join([i.text for i in list_items]),
-                            meta=DocMeta(
-                                doc_items=list_items,
-                                headings=[heading_by_level[k] for k in sorted(heading_by_level)] or None,
-                                origin=dl_doc.origin,
-                            ),
-                        )
-                        list_items = []  # reset
-
-                if isinstance(item, SectionHeaderItem) or (
-                        isinstance(item, TextItem) and item.label in [DocItemLabel.SECTION_HEADER, DocItemLabel.TITLE]):
-                    level = (
-                        item.level
-                        if isinstance(item, SectionHeaderItem)
-                        else (0 if item.label == DocItemLabel.TITLE else 1)
-                    )
-                    heading_by_level[level] = item.text
-                    text = ''.join(str(value) for value in heading_by_level.values())
-
-                    # remove headings of higher level as they just went out of scope
-                    keys_to_del = [k for k in heading_by_level if k > level]
-                    for k in keys_to_del:
-                        heading_by_level.pop(k, None)
-                    c = DocChunk(
-                        text=text,
+            kind = _item_kind(item)
+            if kind is None:
+                continue
+            # first handle any merging needed
+            if self.merge_list_items:
+                if kind == "list":
+                    list_items.append(item)
+                    continue
+                elif list_items:  # need to yield
+                    yield DocChunk(
+                        text=self.delim.join([i.text for i in list_items]),
                         meta=DocMeta(
-                            doc_items=[item],
-                            headings=[heading_by_level[k] for k in sorted(heading_by_level)] or None,
-                            captions=captions,
-                            origin=dl_doc.origin
+                            doc_items=list_items,
+                            headings=headings,
+                            origin=dl_doc.origin,
                         ),
                     )
-                    yield c
-                    continue
+                    list_items = []  # reset
 
-                if isinstance(item, TextItem) or (
-                        (not self.merge_list_items) and isinstance(item, ListItem)) or isinstance(item, CodeItem):
-                    text = item.text
-
-                elif isinstance(item, TableItem):
-                    text = item.export_to_markdown(dl_doc)
-                    # dataframe으로 추출할 때 사용되는 코드
-                    # if table_df.shape[0] < 1 or table_df.shape[1] < 2:
-                    #     # at least two cols needed, as first column contains row headers
-                    #     continue
-                    # text = self._triplet_serialize(table_df=table_df)
-                    captions = [c.text for c in [r.resolve(dl_doc) for r in item.captions]] or None
-
-                elif isinstance(item, PictureItem):
-                    text = ''.join(str(value) for value in heading_by_level.values())
-                else:
-                    continue
+            if kind == "header":
+                level = (
+                    item.level
+                    if isinstance(item, SectionHeaderItem)
+                    else (0 if item.label == DocItemLabel.TITLE else 1)
+                )
+                if level not in heading_by_level:
+                    insort(sorted_levels, level)
+                heading_by_level[level] = item.text
+                text = ''.join(str(value) for value in heading_by_level.values())
+
+                # remove headings of higher level as they just went out of scope
+                while sorted_levels[-1] > level:
+                    heading_by_level.pop(sorted_levels.pop(), None)
+                headings = [heading_by_level[k] for k in sorted_levels]
+                heading_text = ''.join(str(value) for value in heading_by_level.values())
                 c = DocChunk(
                     text=text,
                     meta=DocMeta(
                         doc_items=[item],
-                        headings=[heading_by_level[k] for k in sorted(heading_by_level)] or None,
+                        headings=headings,
                         captions=captions,
-                        origin=dl_doc.origin,
+                        origin=dl_doc.origin
                     ),
                 )
                 yield c
+                continue
+
+            if kind == "text" or kind == "list":
+                text = item.text
+
+            elif kind == "table":
+                text = item.export_to_markdown(dl_doc)
+                # dataframe으로 추출할 때 사용되는 코드
+                # if table_df.shape[0] < 1 or table_df.shape[1] < 2:
+                #     # at least two cols needed, as first column contains row headers
+                #     continue
+                # text = self._triplet_serialize(table_df=table_df)
+                captions = [c.text for c in [r.resolve(dl_doc) for r in item.captions]] or None
+
+            elif kind == "picture":
+                text = heading_text
+            else:
+                continue
+            c = DocChunk(
+                text=text,
+                meta=DocMeta(
+                    doc_items=[item],
+                    headings=headings,
+                    captions=captions,
+                    origin=dl_doc.origin,
+                ),
+            )
+            yield c
 
         if self.merge_list_items and list_items:  # need to yield
             yield DocChunk(
                 text=self.delim.join([i.text for i in list_items]),
                 meta=DocMeta(
                     doc_items=list_items,
-                    headings=[heading_by_level[k] for k in sorted(heading_by_level)] or None,
+                    headings=headings,
                     origin=dl_doc.origin,
                 ),
             )
 
 
+# 이 값 이상의 max_tokens 는 "제한 없음"으로 간주 (DocxProcessor 등은 int(1e30) 사용)
+_NO_TOKEN_LIMIT = 10 ** 12
+
+
+@lru_cache(maxsize=4)
+def _load_tokenizer(name_or_path: str) -> PreTrainedTokenizerBase:
+    # split_documents 마다 청커가 새로 만들어지므로 토크나이저는 프로세스당 한 번만 로드
+    return AutoTokenizer.from_pretrained(name_or_path, use_fast=True)
+
+
 class HybridChunker(BaseChunker):
     r"""Chunker doing tokenization-aware refinements on top of document layout chunking.
     Args:
@@ -786,26 +890,66 @@ class HybridChunker(BaseChunker):
 
     @model_validator(mode="after")
     def _patch_tokenizer_and_max_tokens(self) -> Self:
+        # 토크나이저는 실제로 토큰 수를 셀 때 로드 (토큰 제한이 없으면 로드하지 않음)
         self._tokenizer = (
             self.tokenizer
             if isinstance(self.tokenizer, PreTrainedTokenizerBase)
-            else AutoTokenizer.from_pretrained(self.tokenizer)
+            else None
         )
         if self.max_tokens is None:
             self.max_tokens = TypeAdapter(PositiveInt).validate_python(
-                self._tokenizer.model_max_length
+                self._get_tokenizer().model_max_length
             )
+        # 동일 문자열 재토큰화 방지용 캐시 (윈도우 확장/병합 시 같은 텍스트가 반복 측정됨)
+        self._tok_len_cache: dict[str, int] = {}
+        self._sem_chunkers: dict[int, Any] = {}
         return self
 
+    def _get_tokenizer(self) -> PreTrainedTokenizerBase:
+        if self._tokenizer is None:
+            self._tokenizer = _load_tokenizer(self.tokenizer)
+        return self._tokenizer
+
+    @property
+    def _unlimited(self) -> bool:
+        return self.max_tokens >= _NO_TOKEN_LIMIT
+
+    def _tok_len(self, text: str) -> int:
+        n = self._tok_len_cache.get(text)
+        if n is None:
+            tokenizer = self._get_tokenizer()
+            if getattr(tokenizer, "is_fast", False):
+                # fast tokenizer 는 토큰 문자열 리스트를 만들지 않고 길이만 받아옴
+                length = tokenizer(
+                    text, add_special_tokens=False, return_length=True, verbose=False
+                )["length"]
+                n = length[0] if isinstance(length, list) else length
+            else:
+                n = len(tokenizer.tokenize(text))
+            self._tok_len_cache[text] = n
+        return n
+
+    def _tok_lens(self, texts: list[str]) -> list[int]:
+        # 캐시에 없는 문자열만 모아 fast tokenizer 로 한 번에 토큰화
+        missing = list({t for t in texts if t not in self._tok_len_cache})
+        if missing:
+            tokenizer = self._get_tokenizer()
+            if getattr(tokenizer, "is_fast", False):
+                lengths = tokenizer(
+                    missing, add_special_tokens=False, return_length=True, verbose=False
+                )["length"]
+                self._tok_len_cache.update(zip(missing, lengths))
+            else:
+                for t in missing:
+                    self._tok_len(t)
+        return [self._tok_len_cache[t] for t in texts]
+
     def _count_text_tokens(self, text: Optional[Union[str, list[str]]]):
         if text is None:
             return 0
         elif isinstance(text, list):
-            total = 0
-            for t in text:
-                total += self._count_text_tokens(t)
-            return total
-        return len(self._tokenizer.tokenize(text))
+            return sum(self._tok_lens(text))
+        return self._tok_len(text)
 
     class _ChunkLengthInfo(BaseModel):
         total_len: int
@@ -814,7 +958,7 @@ class HybridChunker(BaseChunker):
 
     def _count_chunk_tokens(self, doc_chunk: DocChunk):
         ser_txt = self.serialize(chunk=doc_chunk)
-        return len(self._tokenizer.tokenize(text=ser_txt))
+        return self._tok_len(ser_txt)
 
     def _doc_chunk_length(self, doc_chunk: DocChunk):
         text_length = self._count_text_tokens(doc_chunk.text)
@@ -850,37 +994,75 @@ class HybridChunker(BaseChunker):
         return new_chunk
 
     def _split_by_doc_items(self, doc_chunk: DocChunk) -> list[DocChunk]:
+        doc_items = doc_chunk.meta.doc_items
+        num_items = len(doc_items)
+        if num_items <= 1:
+            return [doc_chunk] if num_items else []
+
+        # 아이템별 토큰 수를 한 번만 계산하고 누적합으로 윈도우 길이를 O(1)에 구함
+        # (윈도우 텍스트는 TextItem 만 delim 으로 이어 붙이므로 나머지 아이템은 0)
+        is_text = [isinstance(it, TextItem) for it in doc_items]
+        text_lens = iter(self._tok_lens([it.text for it, t in zip(doc_items, is_text) if t]))
+        item_lens = [next(text_lens) if t else 0 for t in is_text]
+        cum_len = list(accumulate(item_lens, initial=0))
+        cum_cnt = list(accumulate(is_text, initial=0))
+        # 헤더/캡션 등 본문 외 토큰 수는 빈 본문으로 직렬화해 한 번만 측정
+        other_len = self._count_chunk_tokens(
+            doc_chunk=DocChunk(
+                text="",
+                meta=DocMeta(
+                    doc_items=doc_items,
+                    headings=doc_chunk.meta.headings,
+                    captions=doc_chunk.meta.captions,
+                    origin=doc_chunk.meta.origin,
+                ),
+            )
+        )
+        delim_len = self._tok_len(self.delim)
+
+        def fits(start: int, end: int) -> bool:
+            n_text = cum_cnt[end + 1] - cum_cnt[start]
+            text_len = cum_len[end + 1] - cum_len[start] + max(n_text - 1, 0) * delim_len
+            return text_len + other_len <= self.max_tokens
+
+        def exact_fits(chunk: DocChunk) -> bool:
+            return self._count_chunk_tokens(doc_chunk=chunk) <= self.max_tokens
+
         chunks = []
         window_start = 0
-        window_end = 0  # an inclusive index
-        num_items = len(doc_chunk.meta.doc_items)
-        while window_end < num_items:
+        while window_start < num_items:
+            # 누적합 추정치로 윈도우 끝 후보를 빠르게 찾음
+            window_end = window_start  # an inclusive index
+            while window_end < num_items - 1 and fits(window_start, window_end + 1):
+                window_end += 1
             new_chunk = self._make_chunk_from_doc_items(
                 doc_chunk=doc_chunk,
                 window_start=window_start,
                 window_end=window_end,
             )
-            if self._count_chunk_tokens(doc_chunk=new_chunk) <= self.max_tokens:
-                if window_end < num_items - 1:
-                    window_end += 1
-                    # 아직 청크에 여유가 있고, 남은 아이템도 있으므로 계속 추가 시도
-                    continue
-                else:
-                    # 현재 윈도우의 모든 아이템이 청크에 들어갔고, 더 이상 아이템이 없음
-                    window_end = num_items  # signalizing the last loop
-            elif window_start == window_end:
-                # 아이템 1개도 청크에 안 들어감 → 단독 청크로 처리, 이후 재분할
-                window_end += 1
-                window_start = window_end
-            else:
-                # 마지막 아이템 빼고 청크 생성 → 남은 아이템으로 새 윈도우 시작
+            # 토큰 수는 이어 붙인 문자열에서 정확히 더해지지 않으므로
+            # 내보내기 전에 실제 직렬화 길이로 윈도우 끝을 보정
+            while window_end > window_start and not exact_fits(new_chunk):
+                window_end -= 1
                 new_chunk = self._make_chunk_from_doc_items(
                     doc_chunk=doc_chunk,
                     window_start=window_start,
-                    window_end=window_end - 1,
+                    window_end=window_end,
                 )
-                window_start = window_end
+            # 아이템 1개도 청크에 안 들어가면 단독 청크로 처리 (이후 재분할)
+            if exact_fits(new_chunk):
+                while window_end < num_items - 1:
+                    candidate = self._make_chunk_from_doc_items(
+                        doc_chunk=doc_chunk,
+                        window_start=window_start,
+                        window_end=window_end + 1,
+                    )
+                    if not exact_fits(candidate):
+                        break
+                    window_end += 1
+                    new_chunk = candidate
             chunks.append(new_chunk)
+            window_start = window_end + 1
         return chunks
 
     def _split_using_plain_text(self, doc_chunk: DocChunk) -> list[DocChunk]:
@@ -890,67 +1072,71 @@ class HybridChunker(BaseChunker):
         else:
             # 헤더/캡션을 제외하고 본문 텍스트에 할당 가능한 토큰 수 계산
             available_length = self.max_tokens - lengths.other_len
-            sem_chunker = semchunk.chunkerify(
-                self._tokenizer, chunk_size=available_length
-            )
             if available_length <= 0:
                 warnings.warn(
                     f"Headers and captions for this chunk are longer than the total amount of size for the chunk, chunk will be ignored: {doc_chunk.text=}"
                     # noqa
                 )
                 return []
+            # chunk_size 별로 semchunk 청커를 한 번만 생성해 재사용
+            sem_chunker = self._sem_chunkers.get(available_length)
+            if sem_chunker is None:
+                sem_chunker = self._sem_chunkers.setdefault(
+                    available_length,
+                    semchunk.chunkerify(self._get_tokenizer(), chunk_size=available_length),
+                )
             text = doc_chunk.text
             segments = sem_chunker.chunk(text)
             chunks = [type(doc_chunk)(text=s, meta=doc_chunk.meta) for s in segments]
             return chunks
 
-    def _merge_chunks_with_matching_metadata(self, chunks: list[DocChunk]):
-        output_chunks = []
-        window_start = 0
-        window_end = 0  # an inclusive index
-        num_chunks = len(chunks)
-
-        while window_end < num_chunks:
-            chunk = chunks[window_end]
-            headings_and_captions = (chunk.meta.headings, chunk.meta.captions)
-            ready_to_append = False
-
-            if window_start == window_end:
-                current_headings_and_captions = headings_and_captions
-                window_end += 1
-                first_chunk_of_window = chunk
-
-            else:
-                chks = chunks[window_start: window_end + 1]
-                doc_items = [it for chk in chks for it in chk.meta.doc_items]
-                candidate = DocChunk(
-                    text=self.delim.join([chk.text for chk in chks]),
-                    meta=DocMeta(
-                        doc_items=doc_items,
-                        headings=current_headings_and_captions[0],
-                        captions=current_headings_and_captions[1],
-                        origin=chunk.meta.origin,
-                    ),
-                )
+    def _split_batch_using_plain_text(self, doc_chunks: list[DocChunk]) -> Iterator[DocChunk]:
+        # 본문/직렬화 텍스트의 토큰 수를 한 번의 배치 호출로 캐시에 채운 뒤 청크별로 분할 (순서 유지)
+        if len(doc_chunks) > 1:
+            self._tok_lens(
+                [c.text for c in doc_chunks] + [self.serialize(chunk=c) for c in doc_chunks]
+            )
+        for doc_chunk in doc_chunks:
+            yield from self._split_using_plain_text(doc_chunk)
 
-                if (headings_and_captions == current_headings_and_captions
-                        and self._count_chunk_tokens(doc_chunk=candidate) <= self.max_tokens
-                ):
-                    # 토큰 수 여유 있음 → 청크 확장 계속
-                    window_end += 1
-                    new_chunk = candidate
-                else:
-                    ready_to_append = True
+    def _merge_chunks_with_matching_metadata(self, chunks: Iterable[DocChunk]) -> Iterator[DocChunk]:
+        # 입력을 스트리밍으로 소비하며 현재 병합 윈도우만 유지
+        window_texts: list[str] = []
+        window_items: list[DocItem] = []
+        first_chunk_of_window: Optional[DocChunk] = None
+        current_headings_and_captions: Optional[tuple[Optional[list[str]], Optional[list[str]]]] = None
+        new_chunk: Optional[DocChunk] = None
 
-            if ready_to_append or window_end == num_chunks:
+        for chunk in chunks:
+            headings_and_captions = (chunk.meta.headings, chunk.meta.captions)
+            if first_chunk_of_window is not None:
+                if headings_and_captions == current_headings_and_captions:
+                    candidate = DocChunk(
+                        text=self.delim.join(window_texts + [chunk.text]),
+                        meta=DocMeta(
+                            doc_items=window_items + chunk.meta.doc_items,
+                            headings=current_headings_and_captions[0],
+                            captions=current_headings_and_captions[1],
+                            origin=chunk.meta.origin,
+                        ),
+                    )
+                    if self._unlimited or self._count_chunk_tokens(doc_chunk=candidate) <= self.max_tokens:
+                        # 토큰 수 여유 있음 → 청크 확장 계속
+                        window_texts.append(chunk.text)
+                        window_items.extend(chunk.meta.doc_items)
+                        new_chunk = candidate
+                        continue
                 # no more room OR the start of new metadata.
-                if window_start + 1 == window_end:
-                    output_chunks.append(first_chunk_of_window)
-                else:
-                    output_chunks.append(new_chunk)
-                window_start = window_end
+                yield new_chunk if new_chunk is not None else first_chunk_of_window
 
-        return output_chunks
+            current_headings_and_captions = headings_and_captions
+            first_chunk_of_window = chunk
+            new_chunk = None
+            window_texts = [chunk.text]
+            window_items = list(chunk.meta.doc_items)
+
+        if first_chunk_of_window is not None:
+            yield new_chunk if new_chunk is not None else first_chunk_of_window
 
     def chunk(self, dl_doc: DoclingDocument, **kwargs: Any) -> Iterator[BaseChunk]:
         r"""Chunk the provided document.
@@ -961,30 +1147,50 @@ class HybridChunker(BaseChunker):
         """
         res: Iterable[DocChunk]
         res = self._inner_chunker.chunk(dl_doc=dl_doc, **kwargs)  # type: ignore
-        res = [x for c in res for x in self._split_by_doc_items(c)]
-        res = [x for c in res for x in self._split_using_plain_text(c)]
+        # 토큰 제한이 사실상 없으면 분할 단계는 결과를 바꾸지 않으므로 건너뜀
+        if not self._unlimited:
+            # 단계별 중간 리스트를 만들지 않고 제너레이터로 흘려보냄
+            res = chain.from_iterable(
+                self._split_batch_using_plain_text(self._split_by_doc_items(c)) for c in res
+            )
 
         if self.merge_peers:
             res = self._merge_chunks_with_matching_metadata(res)
         return iter(res)
 
 
+# 컨버터(파이프라인 포함)는 프로세스당 한 번만 만들고 모든 프로세서 인스턴스가 공유한다
+@lru_cache(maxsize=1)
+def _docx_converter() -> DocumentConverter:
+    return DocumentConverter(
+        format_options={
+            InputFormat.DOCX: WordFormatOption(
+            pipeline_cls=SimplePipeline, backend=GenosMsWordDocumentBackend
+            ),
+        }
+    )
+
+
+@lru_cache(maxsize=1)
+def _hwpx_converter() -> DocumentConverter:
+    pipeline_options = PipelineOptions()
+    pipeline_options.save_images = False
+    return DocumentConverter(
+        format_options={
+            InputFormat.XML_HWPX: HwpxFormatOption(
+                pipeline_options=pipeline_options
+            )
+        }
+    )
+
+
 class DocxProcessor:
     def __init__(self):
-        self.page_chunk_counts = defaultdict(int)
         self.pipeline_options = PipelineOptions()
-        self.converter = DocumentConverter(
-            format_options={
-                InputFormat.DOCX: WordFormatOption(
-                pipeline_cls=SimplePipeline, backend=GenosMsWordDocumentBackend
-                ),
-            }
-        )
+        self.converter = _docx_converter()
 
     def get_paths(self, file_path: str):
-        output_path, output_file = os.path.split(file_path)
-        filename, _ = os.path.splitext(output_file)
-        artifacts_dir = Path(f"{output_path}/{filename}")
+        artifacts_dir = Path(file_path).with_suffix('')
         if artifacts_dir.is_absolute():
             reference_path = None
         else:
@@ -996,7 +1202,7 @@ class DocxProcessor:
         for item in doc_items:
             if isinstance(item, PictureItem):
                 path = str(item.image.uri)
-                name = path.rsplit("/", 1)[-1]
+                name = path.rpartition("/")[2]
                 temp_list.append({'path': path, 'name': name})
         return temp_list
 
@@ -1012,8 +1218,6 @@ class DocxProcessor:
     def split_documents(self, documents: DoclingDocument, **kwargs: dict) -> List[DocChunk]:
         chunker = HybridChunker(max_tokens=int(1e30), merge_peers=True)
         chunks: List[DocChunk] = list(chunker.chunk(dl_doc=documents, **kwargs))
-        for chunk in chunks:
-            self.page_chunk_counts[chunk.meta.doc_items[0].prov[0].page_no] += 1
         return chunks
 
     async def compose_vectors(self, document: DoclingDocument, chunks: List[DocChunk], file_path: str, request: Request,
@@ -1024,27 +1228,41 @@ class DocxProcessor:
             reg_date=datetime.now().isoformat(timespec='seconds') + 'Z',
         )
 
+        # 페이지별 청크 수는 요청마다 새로 계산 (인스턴스가 요청 간에 재사용되므로 누적되면 안 됨)
+        chunk_pages = [chunk.meta.doc_items[0].prov[0].page_no for chunk in chunks]
+        page_chunk_counts = Counter(chunk_pages)
+        # 페이지 크기는 문서 단위로 한 번만 조회
+        page_sizes = {page_no: (page.size.width, page.size.height) for page_no, page in document.pages.items()}
+        media_names: dict[str, str] = {}
+
         current_page = None
         chunk_index_on_page = 0
         vectors = []
         upload_tasks = []
-        for chunk_idx, chunk in enumerate(chunks):
-            chunk_page = chunk.meta.doc_items[0].prov[0].page_no
+        for chunk_idx, (chunk, chunk_page) in enumerate(zip(chunks, chunk_pages)):
             content = self.safe_join(chunk.meta.headings) + chunk.text
 
             if chunk_page != current_page:
                 current_page = chunk_page
                 chunk_index_on_page = 0
 
-            vector = (GenOSVectorMetaBuilder()
-                      .set_text(content)
-                      .set_page_info(chunk_page, chunk_index_on_page, self.page_chunk_counts[chunk_page])
-                      .set_chunk_index(chunk_idx)
-                      .set_global_metadata(**global_metadata)
-                      .set_chunk_bboxes(chunk.meta.doc_items, document)
-                      .set_media_files(chunk.meta.doc_items)
-                      ).build()
-            vectors.append(vector)
+            # 청크마다 빌더 객체를 만들고 다시 복사하지 않도록 필드를 바로 채워 생성
+            doc_items = chunk.meta.doc_items
+            chunk_bboxes, e_page = _chunk_bboxes_json(doc_items, page_sizes)
+            vectors.append(GenOSVectorMeta.model_construct(
+                text=content,
+                n_char=len(content),
+                n_word=len(content.split()),
+                n_line=len(content.splitlines()),
+                i_page=chunk_page,
+                e_page=e_page,
+                i_chunk_on_page=chunk_index_on_page,
+                n_chunk_of_page=page_chunk_counts[chunk_page],
+                i_chunk_on_doc=chunk_idx,
+                chunk_bboxes=chunk_bboxes,
+                media_files=_media_files_json(doc_items, media_names),
+                **global_metadata
+            ))
 
             chunk_index_on_page += 1
             # file_list = self.get_media_files(chunk.meta.doc_items)
@@ -1057,11 +1275,16 @@ class DocxProcessor:
         return vectors
 
     async def __call__(self, request: Request, file_path: str, **kwargs: dict):
-        document: DoclingDocument = self.load_documents(file_path, **kwargs)
+        loop = asyncio.get_running_loop()
+        document: DoclingDocument = await loop.run_in_executor(
+            _CONVERT_EXECUTOR, partial(self.load_documents, file_path, **kwargs)
+        )
         artifacts_dir, reference_path = self.get_paths(file_path)
         document = document._with_pictures_refs(image_dir=artifacts_dir, reference_path=reference_path)
 
-        chunks: list[DocChunk] = self.split_documents(document, **kwargs)
+        chunks: list[DocChunk] = await loop.run_in_executor(
+            _CONVERT_EXECUTOR, partial(self.split_documents, document, **kwargs)
+        )
 
         vectors = []
         if len(chunks) >= 1:
@@ -1073,21 +1296,11 @@ class DocxProcessor:
 
 class HwpxProcessor:
     def __init__(self):
-        self.page_chunk_counts = defaultdict(int)
-        self.pipeline_options = PipelineOptions()
-        self.pipeline_options.save_images = False
-        self.converter = DocumentConverter(
-            format_options={
-                InputFormat.XML_HWPX: HwpxFormatOption(
-                    pipeline_options=self.pipeline_options
-                )
-            }
-        )
+        self.converter = _hwpx_converter()
+        self.pipeline_options = self.converter.format_to_options[InputFormat.XML_HWPX].pipeline_options
 
     def get_paths(self, file_path: str):
-        output_path, output_file = os.path.split(file_path)
-        filename, _ = os.path.splitext(output_file)
-        artifacts_dir = Path(f"{output_path}/{filename}")
+        artifacts_dir = Path(file_path).with_suffix('')
         if artifacts_dir.is_absolute():
             reference_path = None
         else:
@@ -1099,7 +1312,7 @@ class HwpxProcessor:
         for item in doc_items:
             if isinstance(item, PictureItem):
                 path = str(item.image.uri)
-                name = path.rsplit("/", 1)[-1]
+                name = path.rpartition("/")[2]
                 temp_list.append({'path': path, 'name': name})
         return temp_list
 
@@ -1121,8 +1334,6 @@ class HwpxProcessor:
     def split_documents(self, documents: DoclingDocument, **kwargs: dict) -> List[DocChunk]:
         chunker = HybridChunker(max_tokens=int(1e30), merge_peers=True)
         chunks: List[DocChunk] = list(chunker.chunk(dl_doc=documents, **kwargs))
-        for chunk in chunks:
-            self.page_chunk_counts[chunk.meta.doc_items[0].prov[0].page_no] += 1
         return chunks
 
     async def compose_vectors(self, document: DoclingDocument, chunks: List[DocChunk], file_path: str, request: Request,
@@ -1133,27 +1344,41 @@ class HwpxProcessor:
             reg_date=datetime.now().isoformat(timespec='seconds') + 'Z',
         )
 
+        # 페이지별 청크 수는 요청마다 새로 계산 (인스턴스가 요청 간에 재사용되므로 누적되면 안 됨)
+        chunk_pages = [chunk.meta.doc_items[0].prov[0].page_no for chunk in chunks]
+        page_chunk_counts = Counter(chunk_pages)
+        # 페이지 크기는 문서 단위로 한 번만 조회
+        page_sizes = {page_no: (page.size.width, page.size.height) for page_no, page in document.pages.items()}
+        media_names: dict[str, str] = {}
+
         current_page = None
         chunk_index_on_page = 0
         vectors = []
         upload_tasks = []
-        for chunk_idx, chunk in enumerate(chunks):
-            chunk_page = chunk.meta.doc_items[0].prov[0].page_no
+        for chunk_idx, (chunk, chunk_page) in enumerate(zip(chunks, chunk_pages)):
             content = self.safe_join(chunk.meta.headings) + chunk.text
 
             if chunk_page != current_page:
                 current_page = chunk_page
                 chunk_index_on_page = 0
 
-            vector = (GenOSVectorMetaBuilder()
-                      .set_text(content)
-                      .set_page_info(chunk_page, chunk_index_on_page, self.page_chunk_counts[chunk_page])
-                      .set_chunk_index(chunk_idx)
-                      .set_global_metadata(**global_metadata)
-                      .set_chunk_bboxes(chunk.meta.doc_items, document)
-                      .set_media_files(chunk.meta.doc_items)
-                      ).build()
-            vectors.append(vector)
+            # 청크마다 빌더 객체를 만들고 다시 복사하지 않도록 필드를 바로 채워 생성
+            doc_items = chunk.meta.doc_items
+            chunk_bboxes, e_page = _chunk_bboxes_json(doc_items, page_sizes)
+            vectors.append(GenOSVectorMeta.model_construct(
+                text=content,
+                n_char=len(content),
+                n_word=len(content.split()),
+                n_line=len(content.splitlines()),
+                i_page=chunk_page,
+                e_page=e_page,
+                i_chunk_on_page=chunk_index_on_page,
+                n_chunk_of_page=page_chunk_counts[chunk_page],
+                i_chunk_on_doc=chunk_idx,
+                chunk_bboxes=chunk_bboxes,
+                media_files=_media_files_json(doc_items, media_names),
+                **global_metadata
+            ))
 
             chunk_index_on_page += 1
             # file_list = self.get_media_files(chunk.meta.doc_items)
@@ -1166,11 +1391,16 @@ class HwpxProcessor:
         return vectors
 
     async def __call__(self, request: Request, file_path: str, **kwargs: dict):
-        document: DoclingDocument = self.load_documents(file_path, **kwargs)
+        loop = asyncio.get_running_loop()
+        document: DoclingDocument = await loop.run_in_executor(
+            _CONVERT_EXECUTOR, partial(self.load_documents, file_path, **kwargs)
+        )
         artifacts_dir, reference_path = self.get_paths(file_path)
         document = document._with_pictures_refs(image_dir=artifacts_dir, reference_path=reference_path)
 
-        chunks: list[DocChunk] = self.split_documents(document, **kwargs)
+        chunks: list[DocChunk] = await loop.run_in_executor(
+            _CONVERT_EXECUTOR, partial(self.split_documents, document, **kwargs)
+        )
 
         vectors = []
         if len(chunks) >= 1:
@@ -1200,14 +1430,35 @@ class GenosServiceException(Exception):
 #         raise GenosServiceException(1, f"Cancelled")
 
 
+# 한국어 OCR 지원을 위한 언어 설정 (한국어 + 영어 OCR)
+_IMAGE_LOADER = partial(UnstructuredImageLoader, languages=["kor", "eng"])
+# 확장자별 langchain 로더 (등록되지 않은 확장자는 UnstructuredFileLoader)
+_LOADERS = {
+    '.pdf': PyMuPDFLoader,
+    '.doc': UnstructuredWordDocumentLoader,
+    '.ppt': UnstructuredPowerPointLoader,
+    '.pptx': UnstructuredPowerPointLoader,
+    '.jpg': _IMAGE_LOADER,
+    '.jpeg': _IMAGE_LOADER,
+    '.png': _IMAGE_LOADER,
+    '.txt': TextLoader,
+    '.json': TextLoader,
+    '.md': TextLoader,
+    '.hwp': HwpLoader,
+}
+# 로더 생성 전에 PDF 변환을 먼저 수행하는 확장자
+_CONVERT_BEFORE_LOAD = frozenset({'.doc', '.ppt', '.pptx', '.jpg', '.jpeg', '.png'})
+
+
 class DocumentProcessor:
     def __init__(self):
-        self.page_chunk_counts = defaultdict(int)
         self.hwpx_processor = HwpxProcessor()
         self.docx_processor = DocxProcessor()
 
-    def get_loader(self, file_path: str):
-        ext = os.path.splitext(file_path)[-1].lower()
+    def get_loader(self, file_path: str, ext: Optional[str] = None):
+        # ext: __call__에서 이미 구한 소문자 확장자 (없으면 여기서 계산)
+        if ext is None:
+            ext = os.path.splitext(file_path)[-1].lower()
         real_type = self.get_real_file_type(file_path)
 
         # 확장자와 실제 파일 타입이 다를 때만 real_type 사용
@@ -1216,29 +1467,9 @@ class DocumentProcessor:
         elif ext != real_type and real_type in ['txt', 'json', 'md']:
             return TextLoader(file_path)
         # 원래 확장자 기반 로직
-        elif ext == '.pdf':
-            return PyMuPDFLoader(file_path)
-        elif ext == '.doc':
-            convert_to_pdf(file_path)
-            return UnstructuredWordDocumentLoader(file_path)
-        elif ext in ['.ppt', '.pptx']:
-            convert_to_pdf(file_path)
-            return UnstructuredPowerPointLoader(file_path)
-        elif ext in ['.jpg', '.jpeg', '.png']:
+        if ext in _CONVERT_BEFORE_LOAD:
             convert_to_pdf(file_path)
-            # 한국어 OCR 지원을 위한 언어 설정
-            return UnstructuredImageLoader(
-                file_path, 
-                languages=["kor", "eng"],  # 한국어 + 영어 OCR
-            )
-        elif ext in ['.txt', '.json', '.md']:
-            return TextLoader(file_path)
-        elif ext == '.hwp':
-            return HwpLoader(file_path)
-        elif ext == '.md':
-            return UnstructuredMarkdownLoader(file_path)
-        else:
-            return UnstructuredFileLoader(file_path)
+        return _LOADERS.get(ext, UnstructuredFileLoader)(file_path)
 
     def get_real_file_type(self, file_path: str) -> str:
         """파일 확장자가 아닌 실제 내용으로 파일 타입 판단"""
@@ -1287,12 +1518,13 @@ class DocumentProcessor:
             HTML(string=html_content).write_pdf(pdf_path)
         return pdf_path
 
-    def load_documents(self, file_path: str, **kwargs: dict) -> list[Document]:
-        loader = self.get_loader(file_path)
+    def load_documents(self, file_path: str, ext: Optional[str] = None, **kwargs: dict) -> list[Document]:
+        if ext is None:
+            ext = os.path.splitext(file_path)[-1].lower()
+        loader = self.get_loader(file_path, ext)
         documents = loader.load()
         
         # 이미지 파일의 경우 텍스트 추출 안되었을 시 기본 텍스트 제공
-        ext = os.path.splitext(file_path)[-1].lower()
         if ext in ['.jpg', '.jpeg', '.png']:
             # documents가 없거나, 있어도 모든 page_content가 비어있는 경우
             if not documents or not any(doc.page_content.strip() for doc in documents):
@@ -1306,14 +1538,12 @@ class DocumentProcessor:
         chunks = [chunk for chunk in chunks if chunk.page_content]
         if not chunks:
             raise Exception('Empty document')
-
-        for chunk in chunks:
-            page = chunk.metadata.get('page', 0)
-            self.page_chunk_counts[page] += 1
         return chunks
 
-    def compose_vectors(self, file_path: str, chunks: list[Document], **kwargs: dict) -> list[dict]:
-        ext = os.path.splitext(file_path)[-1].lower()
+    def compose_vectors(self, file_path: str, chunks: list[Document], ext: Optional[str] = None,
+                        **kwargs: dict) -> list[dict]:
+        if ext is None:
+            ext = os.path.splitext(file_path)[-1].lower()
         real_type = self.get_real_file_type(file_path)
 
         # 확장자와 실제 파일 타입이 다를 때만 real_type 사용
@@ -1335,51 +1565,48 @@ class DocumentProcessor:
             if os.path.exists(pdf_path):
                 subprocess.run(["rm", pdf_path], check=True)
 
+        # 청크 페이지는 한 번만 훑어 페이지별 청크 수, 마지막 페이지, 본 루프에서 모두 재사용
+        pages = [chunk.metadata.get('page', 0) for chunk in chunks]
+        page_chunk_counts = Counter(pages)
         global_metadata = dict(
             n_chunk_of_doc=len(chunks),
-            n_page=max([chunk.metadata.get('page', 0) for chunk in chunks]),
+            n_page=max(page_chunk_counts, default=0),
             reg_date=datetime.now().isoformat(timespec='seconds') + 'Z'
         )
-        current_page = None
-        chunk_index_on_page = 0
-
         vectors = []
-        for chunk_idx, chunk in enumerate(chunks):
-            page = chunk.metadata.get('page', 0)
-            text = chunk.page_content
-
-            if page != current_page:
-                current_page = page
-                chunk_index_on_page = 0
-
-            # 첨부용에서는 bbox 정보 추출 X
-            # if doc:
-            #     fitz_page = doc.load_page(page)
-            #     global_metadata['chunk_bboxes'] = json.dumps(merge_overlapping_bboxes([{
-            #         'page': page + 1,
-            #         'type': 'text',
-            #         'bbox': {
-            #             'l': rect[0] / fitz_page.rect.width,
-            #             't': rect[1] / fitz_page.rect.height,
-            #             'r': rect[2] / fitz_page.rect.width,
-            #             'b': rect[3] / fitz_page.rect.height,
-            #         }
-            #     } for rect in fitz_page.search_for(text)], x_tolerance=1 / fitz_page.rect.width,
-            #         y_tolerance=1 / fitz_page.rect.height))
-
-            vectors.append(GenOSVectorMeta.model_validate({
-                'text': text,
-                'n_char': len(text),
-                'n_word': len(text.split()),
-                'n_line': len(text.splitlines()),
-                'i_page': page,
-                'e_page': page,
-                'i_chunk_on_page': chunk_index_on_page,
-                'n_chunk_of_page': self.page_chunk_counts[page],
-                'i_chunk_on_doc': chunk_idx,
-                **global_metadata
-            }))
-            chunk_index_on_page += 1
+        # 연속된 같은 페이지의 청크끼리 묶어 페이지 내 인덱스는 enumerate 로 구함
+        for page, run in groupby(enumerate(chunks), key=lambda indexed: pages[indexed[0]]):
+            for chunk_index_on_page, (chunk_idx, chunk) in enumerate(run):
+                text = chunk.page_content
+
+                # 첨부용에서는 bbox 정보 추출 X
+                # if doc:
+                #     fitz_page = doc.load_page(page)
+                #     global_metadata['chunk_bboxes'] = json.dumps(merge_overlapping_bboxes([{
+                #         'page': page + 1,
+                #         'type': 'text',
+                #         'bbox': {
+                #             'l': rect[0] / fitz_page.rect.width,
+                #             't': rect[1] / fitz_page.rect.height,
+                #             'r': rect[2] / fitz_page.rect.width,
+                #             'b': rect[3] / fitz_page.rect.height,
+                #         }
+                #     } for rect in fitz_page.search_for(text)], x_tolerance=1 / fitz_page.rect.width,
+                #         y_tolerance=1 / fitz_page.rect.height))
+
+                # 값이 모두 이미 올바른 타입이므로 청크마다 pydantic 검증을 거치지 않음
+                vectors.append(GenOSVectorMeta.model_construct(
+                    text=text,
+                    n_char=len(text),
+                    n_word=len(text.split()),
+                    n_line=len(text.splitlines()),
+                    i_page=page,
+                    e_page=page,
+                    i_chunk_on_page=chunk_index_on_page,
+                    n_chunk_of_page=page_chunk_counts[page],
+                    i_chunk_on_doc=chunk_idx,
+                    **global_metadata
+                ))
 
         return vectors
 
@@ -1419,6 +1646,8 @@ class DocumentProcessor:
             return vectors
 
         elif ext in ('.csv', '.xlsx'):
+            # 설치가 필요한 경우 이벤트 루프를 막지 않도록 미리 비동기로 설치
+            await install_packages_async(['openpyxl', 'chardet'])
             loader = TabularLoader(file_path, ext)
             vectors = loader.return_vectormeta_format()
             # pdf_path = _get_pdf_path(file_path)
@@ -1426,11 +1655,17 @@ class DocumentProcessor:
             return vectors
 
         elif ext == '.hwp':
-            documents: list[Document] = self.load_documents(file_path, **kwargs)
+            documents: list[Document] = await asyncio.get_running_loop().run_in_executor(
+                _CONVERT_EXECUTOR, partial(self.load_documents, file_path, ext=ext, **kwargs)
+            )
             # await assert_cancelled(request)
-            chunks: list[Document] = self.split_documents(documents, **kwargs)
+            chunks: list[Document] = await asyncio.get_running_loop().run_in_executor(
+                _CONVERT_EXECUTOR, partial(self.split_documents, documents, **kwargs)
+            )
             # await assert_cancelled(request)
-            vectors: list[dict] = self.compose_vectors(file_path, chunks, **kwargs)
+            vectors: list[dict] = await asyncio.get_running_loop().run_in_executor(
+                _CONVERT_EXECUTOR, partial(self.compose_vectors, file_path, chunks, ext=ext, **kwargs)
+            )
             return vectors
 
         elif ext == '.hwpx':
@@ -1440,11 +1675,17 @@ class DocumentProcessor:
             return await self.docx_processor(request, file_path, **kwargs)
         
         else:
-            documents: list[Document] = self.load_documents(file_path, **kwargs)
+            documents: list[Document] = await asyncio.get_running_loop().run_in_executor(
+                _CONVERT_EXECUTOR, partial(self.load_documents, file_path, ext=ext, **kwargs)
+            )
             # await assert_cancelled(request)
 
-            chunks: list[Document] = self.split_documents(documents, **kwargs)
+            chunks: list[Document] = await asyncio.get_running_loop().run_in_executor(
+                _CONVERT_EXECUTOR, partial(self.split_documents, documents, **kwargs)
+            )
             # await assert_cancelled(request)
 
-            vectors: list[dict] = self.compose_vectors(file_path, chunks, **kwargs)
-            return vectors
\ No newline at end of file
+            vectors: list[dict] = await asyncio.get_running_loop().run_in_executor(
+                _CONVERT_EXECUTOR, partial(self.compose_vectors, file_path, chunks, ext=ext, **kwargs)
+            )
+            return vectors
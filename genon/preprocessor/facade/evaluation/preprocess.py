@@ -465,7 +465,8 @@ class HybridChunker(BaseChunker):
         if self.merge_peers:
             res = self._merge_chunks_with_matching_metadata(res)
         return iter(res)
-    
+
+
 class GenOSVectorMeta(BaseModel):
     class Config:
         extra = 'allow'
@@ -4,6 +4,7 @@ import json
 import os
 from pathlib import Path
 from collections import defaultdict
+from contextvars import ContextVar
 from datetime import datetime
 from typing import Optional, Iterable, Any, List, Dict, Tuple
 
@@ -111,6 +112,18 @@ except ImportError:
         "Module requires 'chunking' extra; to install, run: "
         "`pip install 'docling-core[chunking]'`"
     )
+try:
+    import orjson
+
+    def json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    def json_dumps(obj) -> str:
+        # orjson과 같은 compact 출력 (구분자 공백 제거)
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+# 빈 리스트의 JSON 표현 (청크마다 다시 인코딩하지 않도록 상수로 둠)
+_EMPTY_JSON_LIST = "[]"
 
 # from genos_utils import upload_files
 
@@ -124,59 +137,72 @@ except ImportError:
 CONVERTIBLE_EXTENSIONS = [".xlsx", ".md", ".docx", ".pptx"]
 
 
+def _prepare_pdf_conversion(file_path: str):
+    """
+    soffice 변환에 필요한 값(env, 출력 경로, 후보별 명령, 임시 디렉터리)을 준비한다.
+    비ASCII 파일명이면 ASCII 이름의 임시 복사본을 첫 번째 후보로 둔다.
+    """
+    in_path = Path(file_path).resolve()
+    out_dir = in_path.parent
+    pdf_path = in_path.with_suffix(".pdf")
+
+    # headless에서 UTF-8 locale 보장
+    env = os.environ.copy()
+    env.setdefault("LANG", "C.UTF-8")
+    env.setdefault("LC_ALL", "C.UTF-8")
+
+    # 확장자에 따라 필터(특히 .ppt는 impress 필터)
+    ext = in_path.suffix.lower()
+    if ext in (".ppt", ".pptx"):
+        convert_arg = "pdf:impress_pdf_Export"
+    elif ext in (".doc", ".docx"):
+        convert_arg = "pdf:writer_pdf_Export"
+    elif ext in (".xls", ".xlsx", ".csv"):
+        convert_arg = "pdf:calc_pdf_Export"
+    else:
+        convert_arg = "pdf"
+
+    # 비ASCII 파일명 이슈 대비 임시 ASCII 파일명 복사본 시도
+    try:
+        in_path.name.encode("ascii")
+        candidates = [in_path]
+        tmp_dir = None
+    except UnicodeEncodeError:
+        tmp_dir = Path(tempfile.mkdtemp())
+        ascii_name = (
+            unicodedata.normalize("NFKD", in_path.stem)
+            .encode("ascii", "ignore")
+            .decode("ascii")
+            or "file"
+        )
+        ascii_copy = tmp_dir / f"{ascii_name}{in_path.suffix}"
+        shutil.copy2(in_path, ascii_copy)
+        candidates = [ascii_copy, in_path]
+
+    cmds = [
+        [
+            "soffice",
+            "--headless",
+            "--convert-to",
+            convert_arg,
+            "--outdir",
+            str(out_dir),
+            str(cand),
+        ]
+        for cand in candidates
+    ]
+    return env, pdf_path, cmds, tmp_dir
+
+
 def convert_to_pdf(file_path: str) -> str | None:
     """
     LibreOffice로 PDF 변환을 시도한다.
     실패해도 예외를 던지지 않고 None을 반환한다.
     """
     try:
-        in_path = Path(file_path).resolve()
-        out_dir = in_path.parent
-        pdf_path = in_path.with_suffix(".pdf")
-
-        # headless에서 UTF-8 locale 보장
-        env = os.environ.copy()
-        env.setdefault("LANG", "C.UTF-8")
-        env.setdefault("LC_ALL", "C.UTF-8")
-
-        # 확장자에 따라 필터(특히 .ppt는 impress 필터)
-        ext = in_path.suffix.lower()
-        if ext in (".ppt", ".pptx"):
-            convert_arg = "pdf:impress_pdf_Export"
-        elif ext in (".doc", ".docx"):
-            convert_arg = "pdf:writer_pdf_Export"
-        elif ext in (".xls", ".xlsx", ".csv"):
-            convert_arg = "pdf:calc_pdf_Export"
-        else:
-            convert_arg = "pdf"
+        env, pdf_path, cmds, tmp_dir = _prepare_pdf_conversion(file_path)
 
-        # 비ASCII 파일명 이슈 대비 임시 ASCII 파일명 복사본 시도
-        try:
-            in_path.name.encode("ascii")
-            candidates = [in_path]
-            tmp_dir = None
-        except UnicodeEncodeError:
-            tmp_dir = Path(tempfile.mkdtemp())
-            ascii_name = (
-                unicodedata.normalize("NFKD", in_path.stem)
-                .encode("ascii", "ignore")
-                .decode("ascii")
-                or "file"
-            )
-            ascii_copy = tmp_dir / f"{ascii_name}{in_path.suffix}"
-            shutil.copy2(in_path, ascii_copy)
-            candidates = [ascii_copy, in_path]
-
-        for cand in candidates:
-            cmd = [
-                "soffice",
-                "--headless",
-                "--convert-to",
-                convert_arg,
-                "--outdir",
-                str(out_dir),
-                str(cand),
-            ]
+        for cmd in cmds:
             proc = subprocess.run(cmd, env=env, capture_output=True, text=True)
             if proc.returncode == 0 and pdf_path.exists():
                 # 성공
@@ -196,6 +222,40 @@ def convert_to_pdf(file_path: str) -> str | None:
         return None
 
 
+async def convert_to_pdf_async(file_path: str) -> str | None:
+    """
+    convert_to_pdf의 비동기 버전. soffice 실행을 기다리는 동안 이벤트 루프를 막지 않는다.
+    soffice는 같은 사용자 프로필로 동시에 여러 개 띄우면 충돌하므로 후보는 순서대로 시도한다.
+    """
+    try:
+        env, pdf_path, cmds, tmp_dir = _prepare_pdf_conversion(file_path)
+
+        for cmd in cmds:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                env=env,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            stdout, stderr = await proc.communicate()
+            if proc.returncode == 0 and pdf_path.exists():
+                # 성공
+                if tmp_dir:
+                    shutil.rmtree(tmp_dir, ignore_errors=True)
+                return str(pdf_path)
+            # 실패해도 계속 시도 (로그만 찍고 무시)
+            print(f"[convert_to_pdf] stderr: {stderr.decode(errors='replace').strip()}")
+            print(f"[convert_to_pdf] stdout: {stdout.decode(errors='replace').strip()}")
+
+        if tmp_dir:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+        return None
+    except Exception as e:
+        # 어떤 에러든 삼키고 None 반환
+        print(f"[convert_to_pdf] error: {e}")
+        return None
+
+
 def _get_pdf_path(file_path: str) -> str:
     """
     다양한 파일 확장자를 PDF 확장자로 변경하는 공통 함수
@@ -212,6 +272,10 @@ def _get_pdf_path(file_path: str) -> str:
     return pdf_path
 
 
+# 청크 본문에서 비워 둘 페이지 머리말/꼬리말 라벨
+_PAGE_HEADER_FOOTER_LABELS = frozenset({DocItemLabel.PAGE_HEADER, DocItemLabel.PAGE_FOOTER})
+
+
 class HierarchicalChunker(BaseChunker):
     """문서 구조와 헤더 계층을 유지하면서 아이템을 순차적으로 처리하는 청커"""
 
@@ -230,6 +294,8 @@ class HierarchicalChunker(BaseChunker):
         all_items = []
         all_header_info = []  # 각 아이템의 헤더 정보
         current_heading_by_level: dict[LevelNumber, str] = {}
+        # 헤더가 바뀔 때만 새로 만드는 스냅샷 (아이템 간 공유, 읽기 전용)
+        heading_snapshot: dict[LevelNumber, str] = {}
         list_items: list[TextItem] = []
 
         # iterate_items()로 수집된 아이템들의 self_ref 추적
@@ -257,9 +323,7 @@ class HierarchicalChunker(BaseChunker):
                     for list_item in list_items:
                         all_items.append(list_item)
                         # 리스트 아이템의 헤더 정보 저장
-                        all_header_info.append(
-                            {k: v for k, v in current_heading_by_level.items()}
-                        )
+                        all_header_info.append(heading_snapshot)
                     list_items = []
 
             # 섹션 헤더 처리
@@ -279,12 +343,11 @@ class HierarchicalChunker(BaseChunker):
                 keys_to_del = [k for k in current_heading_by_level if k > header_level]
                 for k in keys_to_del:
                     current_heading_by_level.pop(k, None)
+                heading_snapshot = dict(current_heading_by_level)
 
                 # 헤더 아이템도 추가 (헤더 자체도 아이템임)
                 all_items.append(item)
-                all_header_info.append(
-                    {k: v for k, v in current_heading_by_level.items()}
-                )
+                all_header_info.append(heading_snapshot)
                 continue
 
             if (
@@ -294,21 +357,17 @@ class HierarchicalChunker(BaseChunker):
                 or isinstance(item, TableItem)
                 or isinstance(item, PictureItem)
             ):
-                if item.label in [DocItemLabel.PAGE_HEADER, DocItemLabel.PAGE_FOOTER]:
+                if item.label in _PAGE_HEADER_FOOTER_LABELS:
                     item.text = ""
                 all_items.append(item)
                 # 현재 아이템의 헤더 정보 저장
-                all_header_info.append(
-                    {k: v for k, v in current_heading_by_level.items()}
-                )
+                all_header_info.append(heading_snapshot)
 
         # 마지막 리스트 아이템들 처리
         if list_items:
             for list_item in list_items:
                 all_items.append(list_item)
-                all_header_info.append(
-                    {k: v for k, v in current_heading_by_level.items()}
-                )
+                all_header_info.append(heading_snapshot)
 
         # iterate_items()에서 누락된 테이블들을 별도로 추가
         missing_tables = []
@@ -357,6 +416,9 @@ class HybridChunker(BaseChunker):
 
     _inner_chunker: BaseChunker = None
     _tokenizer: PreTrainedTokenizerBase = None
+    _tok_len_cache: dict = None
+    _sem_chunkers: dict = None
+    _table_text_cache: dict = None
 
     @model_validator(mode="after")
     def _initialize_components(self) -> Self:
@@ -367,12 +429,33 @@ class HybridChunker(BaseChunker):
             else AutoTokenizer.from_pretrained(self.tokenizer)
         )
 
+        # 조각 문자열 → 토큰 수 캐시 (병합 후보 텍스트가 커질 때 앞부분 조각은 다시 토큰화하지 않음)
+        self._tok_len_cache = {}
+        # chunk_size → semchunk 청커 (같은 크기로 여러 테이블을 분할할 때 재사용)
+        self._sem_chunkers = {}
+        # TableItem id → 추출된 테이블 텍스트 (chunk() 호출마다 초기화)
+        self._table_text_cache = {}
+
         # HierarchicalChunker 초기화
         if self._inner_chunker is None:
             self._inner_chunker = HierarchicalChunker()
 
         return self
 
+    def _tok_len(self, piece: str) -> int:
+        n = self._tok_len_cache.get(piece)
+        if n is None:
+            if getattr(self._tokenizer, "is_fast", False):
+                # fast tokenizer 는 토큰 문자열 리스트를 만들지 않고 길이만 받아옴
+                length = self._tokenizer(
+                    piece, add_special_tokens=False, return_length=True, verbose=False
+                )["length"]
+                n = length[0] if isinstance(length, list) else length
+            else:
+                n = len(self._tokenizer.tokenize(piece))
+            self._tok_len_cache[piece] = n
+        return n
+
     def _count_tokens(self, text: str) -> int:
         """텍스트의 토큰 수 계산 (안전한 분할 처리)"""
         if not text:
@@ -396,7 +479,7 @@ class HybridChunker(BaseChunker):
                 # 현재 청크가 있으면 토큰 계산
                 if current_chunk:
                     try:
-                        total_tokens += len(self._tokenizer.tokenize(current_chunk))
+                        total_tokens += self._tok_len(current_chunk)
                     except Exception:
                         total_tokens += int(
                             len(current_chunk.split()) * 1.3
@@ -408,7 +491,7 @@ class HybridChunker(BaseChunker):
         # 마지막 청크 처리
         if current_chunk:
             try:
-                total_tokens += len(self._tokenizer.tokenize(current_chunk))
+                total_tokens += self._tok_len(current_chunk)
             except Exception:
                 total_tokens += int(len(current_chunk.split()) * 1.3)  # 대략적인 계산
 
@@ -431,14 +514,16 @@ class HybridChunker(BaseChunker):
             if item_headers != current_section_headers:
                 # 변경된 헤더 레벨들만 추가
                 headers_to_add = []
-                for level in sorted(item_headers.keys()):
+                # 레벨 정렬은 헤더가 바뀐 아이템마다 한 번만
+                levels = sorted(item_headers)
+                for level in levels:
                     # 이전 섹션과 다른 헤더만 추가
                     if (
                         level not in current_section_headers
                         or current_section_headers[level] != item_headers[level]
                     ):
                         # 해당 레벨까지의 모든 상위 헤더 포함
-                        for l in sorted(item_headers.keys()):
+                        for l in levels:
                             if l <= level:
                                 headers_to_add.append(item_headers[l])
                         break
@@ -452,7 +537,7 @@ class HybridChunker(BaseChunker):
 
             # 아이템 텍스트 추가
             if isinstance(item, TableItem):
-                table_text = self._extract_table_text(item, dl_doc)
+                table_text = self._table_text(item, dl_doc)
                 if table_text:
                     text_parts.append(table_text)
             elif hasattr(item, "text") and item.text:
@@ -471,6 +556,22 @@ class HybridChunker(BaseChunker):
         result_text = self.delim.join(text_parts)
         return result_text
 
+    def _table_text(
+        self, table_item: TableItem, dl_doc: DoclingDocument
+    ) -> str:
+        """_extract_table_text 결과를 아이템 단위로 캐시
+
+        후보 청크 텍스트를 다시 만들 때마다 같은 테이블을 export 하지 않도록 함.
+        아이템은 문서가 살아있는 동안 유지되므로 id()를 키로 사용.
+        """
+        key = id(table_item)
+        table_text = self._table_text_cache.get(key)
+        if table_text is None:
+            table_text = self._table_text_cache[key] = self._extract_table_text(
+                table_item, dl_doc
+            )
+        return table_text
+
     def _extract_table_text(
         self, table_item: TableItem, dl_doc: DoclingDocument
     ) -> str:
@@ -546,7 +647,11 @@ class HybridChunker(BaseChunker):
 
         # 단순히 토큰 수 기준으로 텍스트 분할
         # semchunk 사용하여 토큰 제한에 맞게 분할
-        chunker = semchunk.chunkerify(self._tokenizer, chunk_size=max_tokens)
+        chunker = self._sem_chunkers.get(max_tokens)
+        if chunker is None:
+            chunker = self._sem_chunkers[max_tokens] = semchunk.chunkerify(
+                self._tokenizer, chunk_size=max_tokens
+            )
         chunks = chunker(table_text)
         return chunks if chunks else [table_text]
 
@@ -578,7 +683,6 @@ class HybridChunker(BaseChunker):
                     chunk_text = self._generate_text_from_items_with_headers(
                         current_items, current_header_infos, dl_doc
                     )
-                    tokens = self._count_tokens(chunk_text)
 
                     # 실제 사용된 헤더들만 추출
                     used_headers = self._extract_used_headers(current_header_infos)
@@ -626,7 +730,7 @@ class HybridChunker(BaseChunker):
                 # 테이블이 max_tokens를 초과하는 경우, 테이블을 분할
                 if table_tokens > self.max_tokens:
                     # 테이블 텍스트만 추출하여 분할
-                    table_only_text = self._extract_table_text(item, dl_doc)
+                    table_only_text = self._table_text(item, dl_doc)
                     split_tables = self._split_table_text(table_only_text, 4096)
 
                     # 분할된 각 테이블에 대해 청크 생성
@@ -685,7 +789,6 @@ class HybridChunker(BaseChunker):
                     chunk_text = self._generate_text_from_items_with_headers(
                         current_items, current_header_infos, dl_doc
                     )
-                    chunk_tokens = self._count_tokens(chunk_text)
 
                     used_headers = self._extract_used_headers(current_header_infos)
                     result_chunks.append(
@@ -707,7 +810,6 @@ class HybridChunker(BaseChunker):
                     single_text = self._generate_text_from_items_with_headers(
                         [item], [header_info], dl_doc
                     )
-                    single_tokens = self._count_tokens(single_text)
 
                     used_headers = self._extract_used_headers([header_info])
                     result_chunks.append(
@@ -729,7 +831,6 @@ class HybridChunker(BaseChunker):
             chunk_text = self._generate_text_from_items_with_headers(
                 current_items, current_header_infos, dl_doc
             )
-            chunk_tokens = self._count_tokens(chunk_text)
 
             used_headers = self._extract_used_headers(current_header_infos)
             result_chunks.append(
@@ -864,6 +965,8 @@ class HybridChunker(BaseChunker):
         Yields:
             토큰 제한에 맞게 분할된 청크들
         """
+        # 이전 문서의 아이템 id가 재사용될 수 있으므로 문서마다 캐시를 비움
+        self._table_text_cache = {}
         doc_chunks = list(self._inner_chunker.chunk(dl_doc=dl_doc, **kwargs))
 
         if not doc_chunks:
@@ -948,44 +1051,53 @@ class GenOSVectorMetaBuilder:
         return self
 
     def set_chunk_bboxes(
-        self, doc_items: list, document: DoclingDocument
+        self, doc_items: list, page_sizes: dict[int, tuple[float, float]]
     ) -> "GenOSVectorMetaBuilder":
         chunk_bboxes = []
+        append = chunk_bboxes.append
         for item in doc_items:
+            label = item.self_ref
+            type_ = item.label
             for prov in item.prov:
-                label = item.self_ref
-                type_ = item.label
-                size = document.pages.get(prov.page_no).size
                 page_no = prov.page_no
+                width, height = page_sizes[page_no]
                 bbox = prov.bbox
 
                 bbox_data = {
-                    "l": bbox.l / size.width,
-                    "t": bbox.t / size.height,
-                    "r": bbox.r / size.width,
-                    "b": bbox.b / size.height,
+                    "l": bbox.l / width,
+                    "t": bbox.t / height,
+                    "r": bbox.r / width,
+                    "b": bbox.b / height,
                     "coord_origin": bbox.coord_origin.value,
                 }
 
-                chunk_bboxes.append(
-                    {"page": page_no, "bbox": bbox_data, "type": type_, "ref": label}
-                )
-        self.chunk_bboxes = json.dumps(chunk_bboxes)
+                append({"page": page_no, "bbox": bbox_data, "type": type_, "ref": label})
+        self.chunk_bboxes = json_dumps(chunk_bboxes) if chunk_bboxes else _EMPTY_JSON_LIST
         return self
 
-    def set_media_files(self, doc_items: list) -> "GenOSVectorMetaBuilder":
+    def set_media_files(
+        self, doc_items: list, name_cache: Optional[dict[str, str]] = None
+    ) -> "GenOSVectorMetaBuilder":
+        """name_cache: 문서 단위로 공유하는 self_ref → 파일명 캐시 (같은 그림이 여러 청크에 걸칠 때 재계산 방지)"""
+        pictures = [item for item in doc_items if isinstance(item, PictureItem)]
+        if not pictures:
+            self.media_files = _EMPTY_JSON_LIST
+            return self
+        if name_cache is None:
+            name_cache = {}
         temp_list = []
-        for item in doc_items:
-            if isinstance(item, PictureItem):
-                path = str(item.image.uri)
-                name = path.rsplit("/", 1)[-1]
-                temp_list.append({"name": name, "type": "image", "ref": item.self_ref})
-        self.media_files = json.dumps(temp_list)
+        for item in pictures:
+            name = name_cache.get(item.self_ref)
+            if name is None:
+                name = name_cache[item.self_ref] = str(item.image.uri).rpartition("/")[2]
+            temp_list.append({"name": name, "type": "image", "ref": item.self_ref})
+        self.media_files = json_dumps(temp_list)
         return self
 
     def build(self) -> GenOSVectorMeta:
         """설정된 데이터를 사용해 최종적으로 GenOSVectorMeta 객체 생성"""
-        return GenOSVectorMeta(
+        # 빌더가 이미 타입이 맞는 값만 채우므로 청크마다 pydantic 검증을 거치지 않음
+        return GenOSVectorMeta.model_construct(
             text=self.text,
             n_char=self.n_char,
             n_word=self.n_word,
@@ -1005,13 +1117,18 @@ class GenOSVectorMetaBuilder:
         )
 
 
+# 요청(태스크 컨텍스트)별 페이지당 청크 수. 프로세서 인스턴스를 동시 요청이 공유해도 섞이지 않음
+_page_chunk_counts: ContextVar[defaultdict] = ContextVar("page_chunk_counts")
+
+
 class DocumentProcessor:
 
     def __init__(self):
         """
         initialize Document Converter
         """
-        self.page_chunk_counts = defaultdict(int)
+        # docling 변환은 스레드에서 실행하되, 컨버터/모델을 공유하므로 동시에 하나만 실행
+        self._convert_lock = asyncio.Lock()
         device = AcceleratorDevice.AUTO
         num_threads = 8
         accelerator_options = AcceleratorOptions(num_threads=num_threads, device=device)
@@ -1052,6 +1169,16 @@ class DocumentProcessor:
             },
         )
 
+    @property
+    def page_chunk_counts(self) -> defaultdict:
+        """현재 요청의 페이지별 청크 수 (__call__ 시작 시 새로 만들어짐)"""
+        try:
+            return _page_chunk_counts.get()
+        except LookupError:
+            counts = defaultdict(int)
+            _page_chunk_counts.set(counts)
+            return counts
+
     def load_documents_with_docling(
         self, file_path: str, **kwargs: dict
     ) -> DoclingDocument:
@@ -1076,8 +1203,11 @@ class DocumentProcessor:
     ) -> List[DocChunk]:
         chunker: HybridChunker = HybridChunker(max_tokens=2000, merge_peers=True)
         chunks: List[DocChunk] = list(chunker.chunk(dl_doc=documents, **kwargs))
-        for chunk in chunks:
-            self.page_chunk_counts[chunk.meta.doc_items[0].prov[0].page_no] += 1
+        # 청크마다 파이썬 루프로 더하지 않고 Counter(C 구현)로 한 번에 센 뒤 페이지 단위로 누적
+        page_chunk_counts = self.page_chunk_counts
+        chunk_pages = Counter(chunk.meta.doc_items[0].prov[0].page_no for chunk in chunks)
+        for page_no, n_chunks in chunk_pages.items():
+            page_chunk_counts[page_no] += n_chunks
         return chunks
 
     def safe_join(self, iterable):
@@ -1265,6 +1395,9 @@ class DocumentProcessor:
             title=title,
         )
 
+        # 페이지 크기는 청크마다 조회하지 않고 문서당 한 번만 구한다
+        page_sizes = {page_no: (page.size.width, page.size.height) for page_no, page in document.pages.items()}
+        media_names: dict[str, str] = {}
         current_page = None
         chunk_index_on_page = 0
         vectors = []
@@ -1284,8 +1417,8 @@ class DocumentProcessor:
                 )
                 .set_chunk_index(chunk_idx)
                 .set_global_metadata(**global_metadata)
-                .set_chunk_bboxes(chunk.meta.doc_items, document)
-                .set_media_files(chunk.meta.doc_items)
+                .set_chunk_bboxes(chunk.meta.doc_items, page_sizes)
+                .set_media_files(chunk.meta.doc_items, media_names)
             ).build()
             vectors.append(vector)
 
@@ -1313,16 +1446,17 @@ class DocumentProcessor:
         return temp_list
 
     async def __call__(self, request: Request, file_path: str, **kwargs: dict):
-        document: DoclingDocument = self.load_documents(file_path, **kwargs)
+        # 요청마다 새 페이지별 청크 카운터로 시작 (to_thread 작업에도 같은 객체가 전달됨)
+        _page_chunk_counts.set(defaultdict(int))
+        async with self._convert_lock:
+            document: DoclingDocument = await asyncio.to_thread(self.load_documents, file_path, **kwargs)
 
-        ext = Path(file_path).suffix.lower()
-        if ext in ['.pptx', '.docx', '.md']: # pdf 저장 원하는 확장자 추가(pptx, docx, md, xlsx, csv 제공가능)
-            convert_to_pdf(file_path)
-            pdf_path = _get_pdf_path(file_path)
+            ext = Path(file_path).suffix.lower()
+            if ext in ['.pptx', '.docx', '.md']: # pdf 저장 원하는 확장자 추가(pptx, docx, md, xlsx, csv 제공가능)
+                await convert_to_pdf_async(file_path)
+                pdf_path = _get_pdf_path(file_path)
 
-        output_path, output_file = os.path.split(file_path)
-        filename, _ = os.path.splitext(output_file)
-        artifacts_dir = Path(f"{output_path}/{filename}")
+        artifacts_dir = Path(file_path).with_suffix("")
         if artifacts_dir.is_absolute():
             reference_path = None
         else:
@@ -1330,10 +1464,10 @@ class DocumentProcessor:
 
         document = document._with_pictures_refs(image_dir=artifacts_dir, reference_path=reference_path)
 
-        document = self.enrichment(document, **kwargs)
+        document = await asyncio.to_thread(self.enrichment, document, **kwargs)
 
         # Extract Chunk from DoclingDocument
-        chunks: List[DocChunk] = self.split_documents(document, **kwargs)
+        chunks: List[DocChunk] = await asyncio.to_thread(self.split_documents, document, **kwargs)
         # await assert_cancelled(request)
 
         vectors = []
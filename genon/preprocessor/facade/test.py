@@ -5,6 +5,11 @@ import asyncio
 import json
 import time
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # 테스트할 전처리기 임포트
 # from attachment_processor import DocumentProcessor # 첨부용
 # from basic_processor import DocumentProcessor # 기본형
@@ -37,15 +42,31 @@ async def process_document():
     # vectors = await doc_processor(mock_request, file_path, save_images=True, include_wmf=False)
     return vectors
 
-begin = time.time()
-# 메인 루프 실행
-result = asyncio.run(process_document())
 
-result_list_as_dict = [item.model_dump() for item in result]
+def save_result(result_list_as_dict):
+    # 최종적으로 이 리스트를 JSON으로 저장
+    if orjson is not None:
+        with open("result.json", "wb") as f:
+            f.write(orjson.dumps(result_list_as_dict, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open("result.json", "w", encoding="utf-8") as f:
+            json.dump(result_list_as_dict, f, ensure_ascii=False, indent=4)
+
 
-# 최종적으로 이 리스트를 JSON으로 저장
-with open("result.json", "w", encoding="utf-8") as f:
-    json.dump(result_list_as_dict, f, ensure_ascii=False, indent=4)
+async def main():
+    result = await process_document()
+    result_list_as_dict = [item.model_dump() for item in result]
+    # chunk_bboxes는 DB 저장용으로 JSON 문자열이지만, 결과 파일에는 배열 그대로 저장해 이중 파싱을 피함
+    for d in result_list_as_dict:
+        if isinstance(d.get("chunk_bboxes"), str):
+            d["chunk_bboxes"] = json.loads(d["chunk_bboxes"])
+    # 직렬화/파일 쓰기는 이벤트 루프 밖에서 수행
+    await asyncio.to_thread(save_result, result_list_as_dict)
+
+
+begin = time.time()
+# 메인 루프 실행
+asyncio.run(main())
 
 end = time.time()
 print(f"Processing time: {end - begin:.2f} seconds")
@@ -1,7 +1,22 @@
 import os
 import json
+import shutil
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from PIL import Image, ImageDraw, ImageFont
+import cv2
+import numpy as np
+from PIL import Image
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
 
 # 입력 경로
 result_json = Path("/workspace/doc_parser/doc_preprocessors/result.json")
@@ -30,65 +45,129 @@ COLOR = {
 }
 DEFAULT_COLOR = (0, 255, 255)
 
-font = ImageFont.load_default(size=30)  # 폴백
-
-# result.json 읽기
-data = json.loads(result_json.read_text(encoding="utf-8"))
-
-img_paths = sorted(os.listdir(pdf_folder), key=lambda x: int(x.split("_")[0]))
-for img_name in img_paths:
-    img_path = os.path.join(pdf_folder, img_name)
-    im = Image.open(img_path).convert("RGBA")
-    im.save(os.path.join(output_path, img_name))
-
-bboxes = []
-for d in data:
-    bbox = d.get("chunk_bboxes", "[]")
-    bbox = json.loads(bbox)
-    bboxes.extend(bbox)
-
-
-for b_idx, item in enumerate(bboxes):
-    bbox = item.get("bbox", {})
-
-    img_path = os.path.join(output_path, img_paths[item["page"] - 1])
-    im = Image.open(img_path).convert("RGBA")
-    W, H = im.size
-    draw = ImageDraw.Draw(im, "RGBA")
-
-    l = float(bbox.get("l", 0.0))
-    t = float(bbox.get("t", 0.0))
-    r = float(bbox.get("r", 0.0))
-    b = float(bbox.get("b", 0.0))
-    origin = item.get("coord_origin", "BOTTOMLEFT")
-    typ = item.get("type", "text")
-
-    # 정규화 → 픽셀
-    x1 = int(l * W)
-    x2 = int(r * W)
-
-    if origin.upper() == "BOTTOMLEFT":
-        y1 = int((1.0 - t) * H)  # top
-        y2 = int((1.0 - b) * H)  # bottom
-    else:  # 이미 TOPLEFT라면 그대로
-        y1 = int(t * H)
-        y2 = int(b * H)
-
+# OpenCV 내장 폰트 (라벨/번호 모두 ASCII)
+font = cv2.FONT_HERSHEY_SIMPLEX
+LABEL_SCALE = 0.5
+INDEX_SCALE = 1.0
+INDEX_COLOR = (0, 0, 255)  # blue
+
+
+def _label_size(label):
+    (tw, th), _ = cv2.getTextSize(label, font, LABEL_SCALE, 1)
+    return tw, th
+
+
+# 라벨은 타입명뿐이므로 글자 크기를 타입별로 미리 계산
+LABEL_SIZE = {typ: _label_size(typ) for typ in COLOR}
+
+# "{페이지}_..." 파일명의 페이지 번호를 한 번만 계산해 정렬
+with os.scandir(pdf_folder) as it:
+    entries = [(int(e.name.partition("_")[0]), e.name, e.path) for e in it if e.is_file()]
+entries.sort()
+img_paths = [name for _, name, _ in entries]
+img_full = {name: path for _, name, path in entries}
+
+
+def iter_records(path):
+    """result.json의 최상위 원소를 하나씩 스트리밍 (ijson 없으면 전체 로드)"""
+    if ijson is None:
+        yield from json_loads(path.read_bytes())
+        return
+    with open(path, "rb") as f:
+        yield from ijson.items(f, "item")
+
+
+def load_page_bboxes(path):
+    """result.json을 페이지별 (순번, bbox) 목록으로 변환
+
+    chunk_bboxes는 배열(test.py가 저장하는 형식)과 JSON 문자열(예전 형식) 모두 읽는다.
+    """
+    by_page = defaultdict(list)
+    b_idx = 0
+    for d in iter_records(path):
+        cb = d.get("chunk_bboxes") or []
+        cb = json_loads(cb) if isinstance(cb, str) else cb
+        for item in cb:
+            by_page[item["page"]].append((b_idx, item))
+            b_idx += 1
+
+    return dict(by_page)
+
+
+# result.json 읽기 → 페이지별로 bbox를 묶어 이미지당 한 번만 열고 저장
+by_page = load_page_bboxes(result_json)
+
+
+def _to_pixels(items, size):
+    """페이지의 (N,4) 정규화 bbox를 한 번에 픽셀 좌표로 변환"""
+    W, H = size
+    arr = np.array(
+        [
+            [
+                float(item.get("bbox", {}).get(k, 0.0))
+                for k in ("l", "t", "r", "b")
+            ]
+            for _, item in items
+        ],
+        dtype=np.float32,
+    ).reshape(-1, 4)
+    bottomleft = np.array(
+        [item.get("coord_origin", "BOTTOMLEFT").upper() == "BOTTOMLEFT" for _, item in items],
+        dtype=bool,
+    )
+
+    x1 = (arr[:, 0] * W).astype(np.int32)
+    x2 = (arr[:, 2] * W).astype(np.int32)
+    # BOTTOMLEFT면 뒤집고, 이미 TOPLEFT라면 그대로
+    y1 = (np.where(bottomleft, 1.0 - arr[:, 1], arr[:, 1]) * H).astype(np.int32)  # top
+    y2 = (np.where(bottomleft, 1.0 - arr[:, 3], arr[:, 3]) * H).astype(np.int32)  # bottom
+
+    # 넓이가 0이거나 이미지 밖에 있는 bbox는 그리지 않음
+    valid = (x2 > x1) & (y2 > y1) & (x1 < W) & (y1 < H) & (x2 > 0) & (y2 > 0)
+    return x1[valid], y1[valid], x2[valid], y2[valid], np.nonzero(valid)[0]
+
+
+def _draw_box(arr, typ, b_idx, x1, y1, x2, y2):
+    # 이미지 버퍼가 RGB 순서이므로 COLOR를 그대로 사용
     color = COLOR.get(typ, DEFAULT_COLOR)
-    # 외곽선 + 반투명 채움
-    draw.rectangle([x1, y1, x2, y2], outline=color + (255,), width=3)
-    # draw.rectangle([x1, y1, x2, y2], fill=color + (40,))
+    # 외곽선
+    cv2.rectangle(arr, (x1, y1), (x2, y2), color, 3)
 
     # 라벨
     label = f"{typ}"
-    tw, th = draw.textlength(label), 12
+    tw, th = LABEL_SIZE.get(label) or _label_size(label)
     pad = 2
-    draw.rectangle([x1, y1 - th - 2 * pad, x1 + tw + 2 * pad, y1], fill=color + (200,))
-    draw.text((x1 + pad, y1 - th - pad), label, fill=(0, 0, 0, 255))
+    cv2.rectangle(arr, (x1, y1 - th - 2 * pad), (x1 + tw + 2 * pad, y1), color, -1)
+    cv2.putText(arr, label, (x1 + pad, y1 - pad), font, LABEL_SCALE, (0, 0, 0), 1, cv2.LINE_AA)
 
     # 몇번째인지~
     text = str(b_idx + 1)  # 1부터 시작
-    # text_position = (x_min, y_min - 15)  # 숫자를 BBox 위쪽에 배치
-    draw.text([x1, y1 - 15], text, fill="blue", font=font)
-
-    im.save(os.path.join(output_path, img_paths[item["page"] - 1]))
+    # 숫자를 BBox 위쪽에 배치
+    cv2.putText(arr, text, (x1, y1 - 15), font, INDEX_SCALE, INDEX_COLOR, 2, cv2.LINE_AA)
+
+
+def render_page(page, items):
+    img_name = img_paths[page - 1]
+    im = Image.open(img_full[img_name])
+    # JPEG 페이지는 디코더가 바로 RGB로 풀도록 설정 (PNG는 영향 없음)
+    im.draft("RGB", im.size)
+    # 알파 채움을 쓰지 않으므로 RGB(24bpp)로만 그림; 이미 RGB면 변환 복사 생략
+    if im.mode != "RGB":
+        im = im.convert("RGB")
+    arr = np.array(im)
+    x1, y1, x2, y2, keep = (v.tolist() for v in _to_pixels(items, im.size))
+    for n, i in enumerate(keep):
+        b_idx, item = items[i]
+        _draw_box(arr, item.get("type", "text"), b_idx, x1[n], y1[n], x2[n], y2[n])
+    Image.fromarray(arr).save(os.path.join(output_path, img_name))
+
+
+# PNG 디코딩/인코딩은 GIL을 놓으므로 페이지 단위로 병렬 처리
+with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+    list(ex.map(lambda kv: render_page(*kv), by_page.items()))
+
+# bbox가 없는 페이지는 디코딩 없이 바이트 복사만
+touched = {img_paths[page - 1] for page in by_page}
+for img_name in img_paths:
+    if img_name not in touched:
+        shutil.copyfile(img_full[img_name], os.path.join(output_path, img_name))
@@ -105,7 +105,9 @@ async def upload_files(file_list: list[dict], request: Request, concurrency: int
                 finally:
                     await asyncio.to_thread(os.remove, org_path)
 
-        tasks = [_upload_single(item['path'], item['name']) for item in file_list]
+        # 같은 파일이 여러 번 넘어오면 한 번만 업로드 (업로드 후 원본을 삭제하므로 중복 시 실패)
+        unique_files = {item['path']: item for item in file_list}.values()
+        tasks = [_upload_single(item['path'], item['name']) for item in unique_files]
         results = await asyncio.gather(*tasks)
         print(f"\n\n{results=}\n\n", flush=True)
     return results
@@ -3,6 +3,7 @@
     이 코드를 최초에 DB에 넣어야 한다.
 """
 
+import asyncio
 import subprocess
 import os
 import shutil
@@ -11,6 +12,7 @@ import fitz
 import uuid
 
 from collections import defaultdict
+from contextvars import ContextVar
 from datetime import datetime
 from fastapi import Request
 from pydantic import BaseModel
@@ -31,6 +33,19 @@ from weasyprint import HTML
 from genos_utils import upload_files, merge_overlapping_bboxes
 import platform
 
+try:
+    import orjson
+
+    def json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    def json_dumps(obj) -> str:
+        # orjson과 같은 compact/UTF-8 출력
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+# 빈 리스트의 JSON 표현 (청크마다 다시 인코딩하지 않도록 상수로 둠)
+_EMPTY_JSON_LIST = "[]"
+
 # pdf 변환 대상 확장자
 CONVERTIBLE_EXTENSIONS = ['.hwp', '.txt', '.json', '.md']
 
@@ -157,9 +172,20 @@ class TextLoader:
                 shutil.rmtree(self.output_dir)
 
 
+# 요청(태스크 컨텍스트)별 페이지당 청크 수. 프로세서 인스턴스를 동시 요청이 공유해도 섞이지 않음
+_page_chunk_counts: ContextVar[defaultdict] = ContextVar("page_chunk_counts")
+
+
 class DocumentProcessor:
-    def __init__(self):
-        self.page_chunk_counts = defaultdict(int)
+    @property
+    def page_chunk_counts(self) -> defaultdict:
+        """현재 요청의 페이지별 청크 수 (__call__ 시작 시 새로 만들어짐)"""
+        try:
+            return _page_chunk_counts.get()
+        except LookupError:
+            counts = defaultdict(int)
+            _page_chunk_counts.set(counts)
+            return counts
 
     def get_loader(self, file_path: str):
         ext = os.path.splitext(file_path)[-1].lower()
@@ -227,12 +253,17 @@ class DocumentProcessor:
         doc = fitz.open(pdf_path)
         file_list: list[dict] = []
         page_meta: dict[int, list[dict]] = defaultdict(list)
+        # 같은 이미지(xref)가 여러 페이지에 반복되는 경우(로고 등) 한 번만 저장/업로드
+        saved_names: dict[int, str] = {}
 
         for page_index in range(len(doc)):
             page = doc.load_page(page_index)
             for img_idx, img in enumerate(page.get_images(full=True)):
+                xref = img[0]
+                if xref in saved_names:
+                    page_meta[page_index + 1].append({'name': saved_names[xref], 'type': 'image'})
+                    continue
                 try:
-                    xref = img[0]
                     pix = fitz.Pixmap(doc, xref)
 
                     # Convert to RGB if needed
@@ -255,6 +286,7 @@ class DocumentProcessor:
                 finally:
                     pix = None  # Free memory
 
+                saved_names[xref] = img_name
                 file_list.append({'path': img_path, 'name': img_name})
                 page_meta[page_index + 1].append({'name': img_name, 'type': 'image'})
 
@@ -313,7 +345,7 @@ class DocumentProcessor:
                         y_tolerance=1 / fitz_page.rect.height)
 
                     chunk_bboxes_data = merged_bboxes
-                    global_metadata['chunk_bboxes'] = json.dumps(merged_bboxes)
+                    global_metadata['chunk_bboxes'] = json_dumps(merged_bboxes)
 
                     if merged_bboxes:
                         bbox_pages = [bbox.get('page') for bbox in merged_bboxes if bbox.get('page') is not None]
@@ -321,39 +353,43 @@ class DocumentProcessor:
                             i_page_value = min(bbox_pages)  # 최소값
                             e_page_value = max(bbox_pages)  # 최대값
 
-            vectors.append(GenOSVectorMeta.model_validate({
-                'text': text,
-                'n_char': len(text),
-                'n_word': len(text.split()),
-                'n_line': len(text.splitlines()),
-                'i_page': i_page_value,
-                'e_page': e_page_value,
-                'i_chunk_on_page': chunk_index_on_page,
-                'n_chunk_of_page': self.page_chunk_counts[page],
-                'i_chunk_on_doc': chunk_idx,
+            # 모든 값이 이미 올바른 타입이므로 청크마다 pydantic 검증을 거치지 않고 바로 생성
+            vectors.append(GenOSVectorMeta.model_construct(
+                text=text,
+                n_char=len(text),
+                n_word=len(text.split()),
+                n_line=len(text.splitlines()),
+                i_page=i_page_value,
+                e_page=e_page_value,
+                i_chunk_on_page=chunk_index_on_page,
+                n_chunk_of_page=self.page_chunk_counts[page],
+                i_chunk_on_doc=chunk_idx,
                 **global_metadata
-            }))
+            ))
             chunk_index_on_page += 1
 
         return vectors
 
     async def __call__(self, request: Request, file_path: str, **kwargs: dict):
-        documents: list[Document] = self.load_documents(file_path, **kwargs)
+        # 요청마다 새 페이지별 청크 카운터로 시작 (to_thread 작업에도 같은 객체가 전달됨)
+        _page_chunk_counts.set(defaultdict(int))
+        # 파일 파싱/분할/벡터 구성은 블로킹 작업이므로 이벤트 루프 밖에서 실행
+        documents: list[Document] = await asyncio.to_thread(self.load_documents, file_path, **kwargs)
         await assert_cancelled(request)
 
-        chunks: list[Document] = self.split_documents(documents, **kwargs)
+        chunks: list[Document] = await asyncio.to_thread(self.split_documents, documents, **kwargs)
         await assert_cancelled(request)
 
         pdf_path = _get_pdf_path(file_path)
         page_image_meta = await self._extract_page_images(pdf_path, request)
         await assert_cancelled(request)
 
-        vectors = self.compose_vectors(chunks, file_path, **kwargs)
+        vectors = await asyncio.to_thread(self.compose_vectors, chunks, file_path, **kwargs)
 
         for v in vectors:
             if v.i_page in page_image_meta:
-                v.media_files = json.dumps(page_image_meta[v.i_page], ensure_ascii=False)
+                v.media_files = json_dumps(page_image_meta[v.i_page])
             else:
-                v.media_files = json.dumps([])
+                v.media_files = _EMPTY_JSON_LIST
 
         return vectors
\ No newline at end of file
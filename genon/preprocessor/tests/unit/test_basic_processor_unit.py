@@ -277,6 +277,24 @@ class TestBasicProcessor:
         from collections import defaultdict
         assert isinstance(processor.page_chunk_counts, defaultdict), "page_chunk_counts should be defaultdict"
 
+    @pytest.mark.asyncio
+    async def test_page_chunk_counts_isolated_per_task(self, processor):
+        """동시 요청(태스크)끼리 page_chunk_counts가 섞이지 않는지 확인"""
+        import asyncio
+        from collections import defaultdict
+        from facade.basic_processor import _page_chunk_counts
+
+        async def count_pages(n_chunks):
+            _page_chunk_counts.set(defaultdict(int))
+            for _ in range(n_chunks):
+                await asyncio.to_thread(processor.page_chunk_counts.__setitem__, 1,
+                                        processor.page_chunk_counts[1] + 1)
+                await asyncio.sleep(0)
+            return processor.page_chunk_counts[1]
+
+        results = await asyncio.gather(count_pages(2), count_pages(3), count_pages(5))
+        assert results == [2, 3, 5], f"Counts leaked between tasks: {results}"
+
     def test_safe_join_method(self, processor):
         """safe_join 메서드 테스트"""
         # 정상적인 리스트
@@ -40,3 +40,62 @@ def test_docx_backend_convert_on_all_docx_samples(sample_path: Path):
     assert len(doc.texts) >= 1
 
 
+
+
+def _first_none_by_scan(parents: dict) -> int:
+    # _ParentsDict 도입 전 _get_level 의 선형 탐색과 같은 기준
+    for k, v in parents.items():
+        if k >= 0 and v is None:
+            return k
+    return 0
+
+
+@pytest.mark.unit
+def test_parents_dict_first_none_level_matches_scan():
+    import random
+
+    mod = pytest.importorskip("docling.backend.genos_msword_backend")
+    rng = random.Random(0)
+    for _ in range(500):
+        parents = mod._ParentsDict()
+        expected: dict = {}
+        for i in range(-1, 10):
+            parents[i] = None
+            expected[i] = None
+        for _ in range(100):
+            op = rng.random()
+            if op < 0.9:
+                # 리셋 루프처럼 max_levels 를 넘는 키도 추가됨
+                key = rng.randint(-1, 14)
+                value = rng.choice([None, object()])
+                parents[key] = value
+                expected[key] = value
+            elif op < 0.95 and len(expected) > 1:
+                key = rng.choice(list(expected))
+                del parents[key]
+                del expected[key]
+            else:
+                parents.clear()
+                expected.clear()
+            assert parents.first_none_level() == _first_none_by_scan(expected)
+        assert list(parents.items()) == list(expected.items())
+
+
+@pytest.mark.unit
+def test_parents_dict_tracks_temporary_parent_swap():
+    mod = pytest.importorskip("docling.backend.genos_msword_backend")
+    parents = mod._ParentsDict()
+    for i in range(-1, 10):
+        parents[i] = None
+    assert parents.first_none_level() == 0
+
+    group = object()
+    parents[0] = group
+    assert parents.first_none_level() == 1
+    # _handle_textbox_content 처럼 현재 레벨을 잠시 채웠다가 복원
+    parents[1] = object()
+    assert parents.first_none_level() == 2
+    parents[1] = None
+    assert parents.first_none_level() == 1
+    parents[0] = None
+    assert parents.first_none_level() == 0
@@ -0,0 +1,276 @@
+"""
+attachment_processor.py 의 HybridChunker 에 대한 unit test
+최적화한 분할/병합 결과가 기존 구현과 같은지 픽스처 문서로 비교
+"""
+
+import pytest
+
+
+class _BigramTokenizer:
+    """두 글자씩 끊는 토크나이저. 이어 붙인 문자열의 토큰 수가 조각별 합보다 작아질 수 있음"""
+
+    is_fast = False
+    model_max_length = 512
+
+    def tokenize(self, text: str) -> list[str]:
+        return [text[i:i + 2] for i in range(0, len(text), 2)]
+
+
+class _LengthPenaltyTokenizer:
+    """단어 + 40자마다 토큰 1개. 이어 붙인 문자열의 토큰 수가 조각별 합보다 커질 수 있음"""
+
+    is_fast = False
+    model_max_length = 512
+
+    def tokenize(self, text: str) -> list[str]:
+        return text.split() + ["<long>"] * (len(text) // 40)
+
+
+def _build_fixture_document(doc_mod):
+    """중첩 헤더, 긴 리스트, 코드, 표, 그림이 섞인 픽스처 문서"""
+    DocItemLabel = doc_mod.DocItemLabel
+    doc = doc_mod.DoclingDocument(name="fixture")
+    doc.add_title(text="픽스처 문서")
+    for sec in range(3):
+        h1 = doc.add_heading(text=f"{sec + 1}. 장 제목", level=1)
+        doc.add_text(label=DocItemLabel.TEXT, text=f"{sec + 1}장 소개 문단 " * (sec + 2), parent=h1)
+        h2 = doc.add_heading(text=f"{sec + 1}.1 절 제목", level=2, parent=h1)
+        group = doc.add_group(label=doc_mod.GroupLabel.LIST, parent=h2)
+        for i in range(12 + sec * 5):
+            doc.add_list_item(text=f"항목 {i}: " + "내용 " * (i % 6 + 1), parent=group)
+        sub_group = doc.add_group(label=doc_mod.GroupLabel.LIST, parent=group)
+        doc.add_list_item(text="하위 항목", parent=sub_group)
+        doc.add_code(text="def f(x):\n    return x * 2", parent=h2)
+        table = doc_mod.TableData(num_rows=2, num_cols=2)
+        for r in range(2):
+            for c in range(2):
+                table.table_cells.append(doc_mod.TableCell(
+                    text=f"셀 {r}-{c}",
+                    start_row_offset_idx=r, end_row_offset_idx=r + 1,
+                    start_col_offset_idx=c, end_col_offset_idx=c + 1,
+                ))
+        doc.add_table(data=table, parent=h2)
+        doc.add_picture(parent=h2)
+        h3 = doc.add_heading(text=f"{sec + 1}.1.1 항 제목", level=3, parent=h2)
+        doc.add_text(label=DocItemLabel.TEXT, text="세부 설명 " * (sec + 3), parent=h3)
+        doc.add_picture(parent=h3)
+    return doc
+
+
+def _legacy_hierarchical_chunk(chunker, dl_doc):
+    """헤딩 캐시/아이템 분류 캐시 도입 이전의 HierarchicalChunker.chunk"""
+    from docling_core.transforms.chunker import DocChunk, DocMeta
+    from docling_core.types.doc import (
+        DocItem, DocItemLabel, PictureItem, SectionHeaderItem, TableItem, TextItem,
+    )
+    from docling_core.types.doc.document import CodeItem, ListItem
+
+    heading_by_level = {}
+    list_items = []
+    for item, level in dl_doc.iterate_items():
+        captions = None
+        if not isinstance(item, DocItem):
+            continue
+        if chunker.merge_list_items:
+            if isinstance(item, ListItem) or (
+                    isinstance(item, TextItem) and item.label == DocItemLabel.LIST_ITEM):
+                list_items.append(item)
+                continue
+            elif list_items:
+                yield DocChunk(
+                    text=chunker.delim.join([i.text for i in list_items]),
+                    meta=DocMeta(
+                        doc_items=list_items,
+                        headings=[heading_by_level[k] for k in sorted(heading_by_level)] or None,
+                        origin=dl_doc.origin,
+                    ),
+                )
+                list_items = []
+
+        if isinstance(item, SectionHeaderItem) or (
+                isinstance(item, TextItem) and item.label in [DocItemLabel.SECTION_HEADER, DocItemLabel.TITLE]):
+            level = (
+                item.level
+                if isinstance(item, SectionHeaderItem)
+                else (0 if item.label == DocItemLabel.TITLE else 1)
+            )
+            heading_by_level[level] = item.text
+            text = ''.join(str(value) for value in heading_by_level.values())
+            for k in [k for k in heading_by_level if k > level]:
+                heading_by_level.pop(k, None)
+            yield DocChunk(
+                text=text,
+                meta=DocMeta(
+                    doc_items=[item],
+                    headings=[heading_by_level[k] for k in sorted(heading_by_level)] or None,
+                    captions=captions,
+                    origin=dl_doc.origin,
+                ),
+            )
+            continue
+
+        if isinstance(item, TextItem) or (
+                (not chunker.merge_list_items) and isinstance(item, ListItem)) or isinstance(item, CodeItem):
+            text = item.text
+        elif isinstance(item, TableItem):
+            text = item.export_to_markdown(dl_doc)
+            captions = [c.text for c in [r.resolve(dl_doc) for r in item.captions]] or None
+        elif isinstance(item, PictureItem):
+            text = ''.join(str(value) for value in heading_by_level.values())
+        else:
+            continue
+        yield DocChunk(
+            text=text,
+            meta=DocMeta(
+                doc_items=[item],
+                headings=[heading_by_level[k] for k in sorted(heading_by_level)] or None,
+                captions=captions,
+                origin=dl_doc.origin,
+            ),
+        )
+
+    if chunker.merge_list_items and list_items:
+        yield DocChunk(
+            text=chunker.delim.join([i.text for i in list_items]),
+            meta=DocMeta(
+                doc_items=list_items,
+                headings=[heading_by_level[k] for k in sorted(heading_by_level)] or None,
+                origin=dl_doc.origin,
+            ),
+        )
+
+
+def _legacy_split_by_doc_items(chunker, doc_chunk):
+    """누적합 최적화 이전의 _split_by_doc_items (윈도우마다 실제 직렬화 토큰 수를 측정)"""
+    chunks = []
+    window_start = 0
+    window_end = 0
+    num_items = len(doc_chunk.meta.doc_items)
+    while window_end < num_items:
+        new_chunk = chunker._make_chunk_from_doc_items(
+            doc_chunk=doc_chunk, window_start=window_start, window_end=window_end,
+        )
+        if chunker._count_chunk_tokens(doc_chunk=new_chunk) <= chunker.max_tokens:
+            if window_end < num_items - 1:
+                window_end += 1
+                continue
+            window_end = num_items
+        elif window_start == window_end:
+            window_end += 1
+            window_start = window_end
+        else:
+            new_chunk = chunker._make_chunk_from_doc_items(
+                doc_chunk=doc_chunk, window_start=window_start, window_end=window_end - 1,
+            )
+            window_start = window_end
+        chunks.append(new_chunk)
+    return chunks
+
+
+def _legacy_merge_chunks_with_matching_metadata(chunker, chunks):
+    """스트리밍 병합 이전의 _merge_chunks_with_matching_metadata (인덱스 기반)"""
+    from docling_core.transforms.chunker import DocChunk, DocMeta
+
+    output_chunks = []
+    window_start = 0
+    window_end = 0
+    num_chunks = len(chunks)
+    while window_end < num_chunks:
+        chunk = chunks[window_end]
+        headings_and_captions = (chunk.meta.headings, chunk.meta.captions)
+        ready_to_append = False
+        if window_start == window_end:
+            current_headings_and_captions = headings_and_captions
+            window_end += 1
+            first_chunk_of_window = chunk
+        else:
+            chks = chunks[window_start: window_end + 1]
+            candidate = DocChunk(
+                text=chunker.delim.join([chk.text for chk in chks]),
+                meta=DocMeta(
+                    doc_items=[it for chk in chks for it in chk.meta.doc_items],
+                    headings=current_headings_and_captions[0],
+                    captions=current_headings_and_captions[1],
+                    origin=chunk.meta.origin,
+                ),
+            )
+            if (headings_and_captions == current_headings_and_captions
+                    and chunker._count_chunk_tokens(doc_chunk=candidate) <= chunker.max_tokens):
+                window_end += 1
+                new_chunk = candidate
+            else:
+                ready_to_append = True
+        if ready_to_append or window_end == num_chunks:
+            if window_start + 1 == window_end:
+                output_chunks.append(first_chunk_of_window)
+            else:
+                output_chunks.append(new_chunk)
+            window_start = window_end
+    return output_chunks
+
+
+def _chunk_signature(chunks):
+    return [
+        (c.text, [it.self_ref for it in c.meta.doc_items], c.meta.headings, c.meta.captions)
+        for c in chunks
+    ]
+
+
+def _make_chunker(mod, tokenizer, max_tokens):
+    chunker = mod.HybridChunker(tokenizer="unused", max_tokens=max_tokens, merge_peers=True)
+    chunker._tokenizer = tokenizer
+    return chunker
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("merge_list_items", [True, False])
+def test_hierarchical_chunker_matches_legacy_chunker(merge_list_items):
+    mod = pytest.importorskip("facade.attachment_processor")
+    doc_mod = pytest.importorskip("docling_core.types.doc")
+    doc = _build_fixture_document(doc_mod)
+    chunker = mod.HierarchicalChunker(merge_list_items=merge_list_items)
+
+    expected = list(_legacy_hierarchical_chunk(chunker, doc))
+    actual = list(chunker.chunk(dl_doc=doc))
+    assert _chunk_signature(actual) == _chunk_signature(expected)
+    # 픽스처가 헤더/리스트/코드/표/그림 분기를 모두 거치는지 확인
+    kinds = {mod._item_kind(it) for c in actual for it in c.meta.doc_items}
+    assert {"header", "list", "text", "table", "picture"} <= kinds
+    assert any(isinstance(it, mod.CodeItem) for c in actual for it in c.meta.doc_items)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("tokenizer_cls", [_BigramTokenizer, _LengthPenaltyTokenizer])
+@pytest.mark.parametrize("max_tokens", [8, 20, 40, 80])
+def test_split_by_doc_items_matches_legacy_splitter(tokenizer_cls, max_tokens):
+    mod = pytest.importorskip("facade.attachment_processor")
+    doc_mod = pytest.importorskip("docling_core.types.doc")
+    doc = _build_fixture_document(doc_mod)
+    chunker = _make_chunker(mod, tokenizer_cls(), max_tokens)
+
+    doc_chunks = list(chunker._inner_chunker.chunk(dl_doc=doc))
+    assert any(len(c.meta.doc_items) > 1 for c in doc_chunks)
+    for doc_chunk in doc_chunks:
+        expected = _legacy_split_by_doc_items(chunker, doc_chunk)
+        actual = chunker._split_by_doc_items(doc_chunk)
+        assert _chunk_signature(actual) == _chunk_signature(expected)
+        # 여러 아이템으로 된 윈도우는 실제 직렬화 토큰 수가 제한을 넘지 않아야 함
+        for c in actual:
+            if len(c.meta.doc_items) > 1:
+                assert chunker._count_chunk_tokens(doc_chunk=c) <= max_tokens
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("tokenizer_cls", [_BigramTokenizer, _LengthPenaltyTokenizer])
+@pytest.mark.parametrize("max_tokens", [8, 20, 40, 80, int(1e30)])
+def test_merge_chunks_matches_legacy_merger(tokenizer_cls, max_tokens):
+    mod = pytest.importorskip("facade.attachment_processor")
+    doc_mod = pytest.importorskip("docling_core.types.doc")
+    doc = _build_fixture_document(doc_mod)
+    chunker = _make_chunker(mod, tokenizer_cls(), max_tokens)
+
+    doc_chunks = list(chunker._inner_chunker.chunk(dl_doc=doc))
+    expected = _legacy_merge_chunks_with_matching_metadata(chunker, doc_chunks)
+    actual = list(chunker._merge_chunks_with_matching_metadata(iter(doc_chunks)))
+    assert _chunk_signature(actual) == _chunk_signature(expected)
+    assert list(chunker._merge_chunks_with_matching_metadata(iter([]))) == []